@@ -1,28 +1,60 @@
-import math
 import numpy as np
 
-c = 299792458000  # mm/s
+from .kernels import c, get_kernel, inset_fed_outline
+from .validation import (ERR_ASPECT, ERR_INPUT, ERR_LENGTH, ERR_NON_FINITE, ERR_PERMITTIVITY,
+                         describe_errors, flag)
+
+# Rows and columns of the Jacobian returned by calculate_batch(jacobian=True)
+JACOBIAN_OUTPUTS = ('W', 'L', 'f_res', 'S11', 'Wf')
+JACOBIAN_INPUTS = ('f', 'e', 'h', 't', 'Zo')
 
 class AntennaCalculator:
     """Backend calculations for antenna design"""
 
-    def __init__(self):
+    def __init__(self, history=None):
         self.current_results = {}
+        # Optional DesignHistory; every successful calculation is appended
+        self.history = history
 
     def calculate_parameters(self, f, e, t, h, Zo, antenna_type, auto_calculate_h=False):
         """Calculate parameters based on antenna type"""
-        try:
-            f_hz = f * 1e9
+        batch = self.calculate_batch(f, e, t, h, Zo, antenna_type, auto_calculate_h, validate=True)
+        error_code = int(batch.pop('error_code'))
+        batch.pop('status')
+        if error_code:
+            raise ValueError(f"Calculation error: {'; '.join(describe_errors(error_code))}")
+
+        results = {key: value.item() if isinstance(value, (np.ndarray, np.generic)) else value
+                   for key, value in batch.items()}
+        self.current_results = results
+        if self.history is not None:
+            self.history.append(results)
+        return results
+
+    def calculate_batch(self, f, e, t, h, Zo, antenna_type, auto_calculate_h=False, jacobian=False,
+                        validate=False):
+        """Vectorized calculate_parameters for arrays of designs
 
+        Inputs are broadcast against each other and every output is an array of
+        the broadcast shape. Rows outside the model's domain come back as
+        nan/inf rather than raising. With validate=True every row is checked
+        (see validate_batch) and 'error_code' and 'status' (True where valid)
+        are added. With jacobian=True the analytic derivatives are added under
+        'jacobian' (see _calculate_jacobian).
+        """
+        f, e, t, h, Zo = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (f, e, t, h, Zo)))
+        f_hz = f * 1e9
+
+        with np.errstate(all='ignore'):
             # Auto-calculate h if needed
             if auto_calculate_h:
-                h = (0.3 * c) / (2 * math.pi * f_hz * math.sqrt(e))
+                h = (0.3 * c) / (2 * np.pi * f_hz * np.sqrt(e))
 
             # Calculate basic parameters (common to all antenna types)
-            W = c / (2 * f_hz * math.sqrt((e + 1) / 2))
-            ereff = ((e + 1) / 2) + (((e - 1) / 2) * (1 / math.sqrt(1 + 12 * (h / W))))
-            leff = c / (2 * f_hz * math.sqrt(ereff))
-            dl = 0.412 * h * (((ereff + 0.3) * ((W / h) + 0.264)) / ((ereff - 0.258) * ((W / h) - 0.8)))
+            W = c / (2 * f_hz * np.sqrt((e + 1) / 2))
+            ereff = self._effective_permittivity(e, h, W)
+            leff = c / (2 * f_hz * np.sqrt(ereff))
+            dl = self._fringing_extension(ereff, h, W)
             L = leff - (2 * dl)
             Lg, Wg = L + (6 * h), W + (6 * h)
 
@@ -43,47 +75,313 @@ class AntennaCalculator:
             }
 
             # Calculate type-specific parameters
-            if antenna_type == "Microstrip Patch Antenna (Inset-Fed)":
-                Fi = ((10 ** -4) * ((0.001699 * e ** 7) + (0.13761 * e ** 6) - (6.1783 * e ** 5) +
-                                    (93.187 * e ** 4) - (682.69 * e ** 3) + (2561.9 * e ** 2) -
-                                    (4043 * e) + 6697) * (L / 2)) * 0.83477
-                Wf = ((7.48 * h) / (math.e ** (Zo * ((math.sqrt(e + 1.41)) / 87)))) - (1.25 * t)
-                Rin = W ** 2 / (1.5 * e)
-                Zin = Zo / (1 + (Zo / Rin))
-                Γ = (Zin - Zo) / (Zin + Zo)
-                S11 = 20 * math.log10(abs(Γ))
-                VSWR = (1 + abs(Γ)) / (1 - abs(Γ))
-
-                results.update({
-                    'Fi': Fi,
-                    'Wf': Wf,
-                    'S11': S11,
-                    'VSWR': VSWR,
-                    'Rin': Rin,
-                    'Zin': Zin
-                })
-
-            elif antenna_type == "Coaxial Feed Patch Antenna (Beta)":
-                Xf = L / (2 * math.sqrt(ereff))
-                Yf = W / (3 * math.sqrt(ereff))
-                results.update({
-                    'Xf': Xf,
-                    'Yf': Yf
-                })
-
-            elif antenna_type == "Circularly Polarized Antennas (Beta)":
-                Q = (c * math.sqrt(ereff)) / (4 * f_hz * h)
-                a = L * math.sqrt(1 / (2 * Q))
-                results.update({
-                    'a': a,
-                    'Q': Q
-                })
-
-            self.current_results = results
-            return results
-
-        except Exception as e:
-            raise Exception(f"Calculation error: {str(e)}")
+            kernel = get_kernel(antenna_type)
+            results.update(kernel.compute(results))
+
+            if validate:
+                results['error_code'] = self.validate_batch(results, kernel)
+                results['status'] = results['error_code'] == 0
+
+            if jacobian:
+                if not kernel.rectangular:
+                    raise ValueError(f"The Jacobian model covers rectangular patches only, not '{antenna_type}'")
+                results['jacobian'] = self._calculate_jacobian(results, auto_calculate_h)
+
+        return results
+
+    def validate_batch(self, results, kernel=None):
+        """Per-row error codes of batch results: OR of validation.ERR_* flags, 0 if valid
+
+        All domain checks run as array operations over the whole batch, so a
+        bad row is reported instead of aborting its neighbours.
+        """
+        kernel = kernel or get_kernel(results['antenna_type'])
+        f, e, t, h, Zo = (results[key] for key in ('f', 'e', 't', 'h', 'Zo'))
+        W, L = results['W'], results['L']
+
+        with np.errstate(all='ignore'):
+            inputs = np.isfinite(f) & np.isfinite(e) & np.isfinite(t) & np.isfinite(h) & np.isfinite(Zo)
+            inputs &= (f > 0) & (e > 0) & (t >= 0) & (h > 0) & (Zo > 0)
+
+            code = flag(~inputs, ERR_INPUT)
+            code |= flag(~(e >= 1), ERR_PERMITTIVITY)
+            code |= flag(~(W / h > 0.8), ERR_ASPECT)
+            code |= flag(~(L > 0), ERR_LENGTH)
+            code |= kernel.validate(results)
+
+            outputs = np.ones(np.shape(f), dtype=bool)
+            for key, value in results.items():
+                if key not in ('antenna_type', 'jacobian', 'error_code', 'status'):
+                    outputs &= np.isfinite(value)
+            code |= flag(~outputs, ERR_NON_FINITE)
+
+        return code
+
+    def calculate_mixed_batch(self, f, e, t, h, Zo, antenna_types, auto_calculate_h=False,
+                              validate=False):
+        """calculate_batch for rows of different antenna types
+
+        antenna_types broadcasts with the other inputs. Rows are grouped by
+        type and each group is computed in one calculate_batch call. Outputs
+        are the union of every present type's outputs, as floats with NaN on
+        rows whose type does not produce them; 'antenna_type' is the array of
+        row types.
+        """
+        arrays = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (f, e, t, h, Zo)),
+                                     np.asarray(antenna_types, dtype=object))
+        f, e, t, h, Zo = (a.ravel() for a in arrays[:5])
+        types = arrays[5].ravel()
+        shape = arrays[0].shape
+
+        names, group = np.unique(types.astype(str), return_inverse=True)
+        results = {}
+        for k, name in enumerate(names):
+            rows = np.flatnonzero(group == k)
+            batch = self.calculate_batch(f[rows], e[rows], t[rows], h[rows], Zo[rows],
+                                         name, auto_calculate_h, validate=validate)
+            for key, value in batch.items():
+                if key == 'antenna_type':
+                    continue
+                if key not in results:
+                    # Validation covers every row; other outputs may be missing for some types
+                    if key in ('error_code', 'status'):
+                        results[key] = np.zeros(f.shape, dtype=value.dtype)
+                    else:
+                        results[key] = np.full(f.shape, np.nan)
+                results[key][rows] = value
+
+        results = {key: value.reshape(shape) for key, value in results.items()}
+        results['antenna_type'] = types.reshape(shape)
+        return results
+
+    def _calculate_jacobian(self, results, auto_calculate_h=False):
+        """Analytic d(W, L, f_res, S11, Wf)/d(f, εr, h, t, Zo) from computed values
+
+        Forward-mode chain rule through the closed-form design equations, one
+        derivative vector (last axis, ordered as JACOBIAN_INPUTS) per
+        intermediate, reusing the values already in results. f_res is the
+        resonance of the patch with its W and L held at their designed values,
+        i.e. the sensitivity of the built board to material variations.
+        Outputs the antenna type does not produce are NaN.
+        """
+        f, e, h, Zo = (results[key] for key in ('f', 'e', 'h', 'Zo'))
+        W, L, ereff, leff, dl = (results[key] for key in ('W', 'L', 'ereff', 'leff', 'dl'))
+        unit = np.eye(len(JACOBIAN_INPUTS))
+        df, de, dt, dZo = unit[0], unit[1], unit[3], unit[4]
+
+        # Derivative vectors broadcast as (..., 5)
+        def col(x):
+            return np.asarray(x)[..., None]
+
+        if auto_calculate_h:
+            dh = col(h) * (-col(1 / f) * df - col(1 / (2 * e)) * de)
+        else:
+            dh = np.broadcast_to(unit[2], h.shape + (len(JACOBIAN_INPUTS),))
+
+        dW = col(W) * (-col(1 / f) * df - col(1 / (2 * (e + 1))) * de)
+
+        def d_ereff(dW):
+            u = h / W
+            du = col(u) * (dh / col(h) - dW / col(W))
+            ds = col(-6 * (1 + 12 * u) ** -1.5) * du
+            return col(0.5 + 0.5 / np.sqrt(1 + 12 * u)) * de + col((e - 1) / 2) * ds
+
+        def d_fringing(dW, dereff):
+            r = W / h
+            dr = col(r) * (dW / col(W) - dh / col(h))
+            return col(dl) * (dh / col(h) + dereff / col(ereff + 0.3) + dr / col(r + 0.264) -
+                              dereff / col(ereff - 0.258) - dr / col(r - 0.8))
+
+        dereff = d_ereff(dW)
+        dleff = col(leff) * (-col(1 / f) * df - dereff / col(2 * ereff))
+        dL = dleff - 2 * d_fringing(dW, dereff)
+
+        # Resonance of the built patch: W and L fixed, so only εr and h act
+        dW_fixed = np.zeros_like(dW)
+        dereff_fixed = d_ereff(dW_fixed)
+        f_res = c / (2 * (L + 2 * dl) * np.sqrt(ereff)) / 1e9
+        df_res = col(f_res) * (-2 * d_fringing(dW_fixed, dereff_fixed) / col(L + 2 * dl) -
+                               dereff_fixed / col(2 * ereff))
+
+        nan = np.full_like(dW, np.nan)
+        dS11, dWf = nan, nan
+        if 'S11' in results:
+            Rin, Zin = results['Rin'], results['Zin']
+            dRin = col(Rin) * (2 * dW / col(W) - de / col(e))
+            dZin = (col(Rin ** 2) * dZo + col(Zo ** 2) * dRin) / col((Rin + Zo) ** 2)
+            gamma = (Zin - Zo) / (Zin + Zo)
+            dgamma = 2 * (col(Zo) * dZin - col(Zin) * dZo) / col((Zin + Zo) ** 2)
+            dS11 = (20 / np.log(10)) * dgamma / col(gamma)
+
+            q = np.sqrt(e + 1.41)
+            A = (7.48 * h) / np.exp(Zo * q / 87)
+            dA = col(A) * (dh / col(h) - (col(q) * dZo + col(Zo / (2 * q)) * de) / 87)
+            dWf = dA - 1.25 * dt
+
+        return np.stack([dW, dL, df_res, dS11, dWf], axis=-2)
+
+    @staticmethod
+    def _effective_permittivity(e, h, W):
+        """Effective dielectric constant of a microstrip of width W"""
+        return ((e + 1) / 2) + (((e - 1) / 2) * (1 / np.sqrt(1 + 12 * (h / W))))
+
+    @staticmethod
+    def _fringing_extension(ereff, h, W):
+        """Length extension ΔL from fringing at each radiating edge"""
+        return 0.412 * h * (((ereff + 0.3) * ((W / h) + 0.264)) / ((ereff - 0.258) * ((W / h) - 0.8)))
+
+    def calculate_resonant_frequency(self, e, h, W, L):
+        """Dominant-mode resonant frequency (GHz) of a W x L patch
+
+        Inverse of the design equations: for the W and L that calculate_batch
+        returns this gives back the design frequency. Works on arrays.
+        """
+        with np.errstate(all='ignore'):
+            ereff = self._effective_permittivity(e, h, W)
+            dl = self._fringing_extension(ereff, h, W)
+            return c / (2 * (L + 2 * dl) * np.sqrt(ereff)) / 1e9
+
+    def calculate_mode_spectrum(self, results, n_modes=6):
+        """Lowest n_modes cavity-model TMmn resonances (GHz) of each design
+
+        m counts half waves along L and n along W, so TM10 is the mode the
+        design targets and TM01 the orthogonal one (below TM10 whenever
+        W > L, as for the usual W from the design equations). Both edges are extended by the
+        fringing dl and the cavity is filled with ereff, which makes TM10
+        agree with calculate_resonant_frequency. Returns 'frequencies', 'm'
+        and 'n', each of shape (..., n_modes) and sorted by frequency.
+        """
+        for antenna_type in dict.fromkeys(np.ravel(results['antenna_type']).tolist()):
+            if not get_kernel(antenna_type).rectangular:
+                raise ValueError(f"The mode spectrum covers rectangular patches only, not '{antenna_type}'")
+        ereff, dl = np.asarray(results['ereff'], dtype=float), np.asarray(results['dl'], dtype=float)
+        L_eff = np.asarray(results['L'], dtype=float) + 2 * dl
+        W_eff = np.asarray(results['W'], dtype=float) + 2 * dl
+
+        # Every (m', n') <= (m, n) resonates no higher than TMmn, so a mode among
+        # the n_modes lowest has (m + 1)(n + 1) - 1 <= n_modes
+        order = np.arange(n_modes + 1)
+        m, n = (a.ravel() for a in np.meshgrid(order, order, indexing='ij'))
+        candidate = ((m + 1) * (n + 1) <= n_modes + 1) & ((m + n) > 0)
+        m, n = m[candidate], n[candidate]
+
+        with np.errstate(all='ignore'):
+            frequencies = (c / (2 * np.sqrt(ereff[..., None])) *
+                           np.sqrt((m / L_eff[..., None]) ** 2 + (n / W_eff[..., None]) ** 2)) / 1e9
+
+        lowest = np.argpartition(frequencies, n_modes - 1, axis=-1)[..., :n_modes]
+        lowest = np.take_along_axis(lowest, np.argsort(
+            np.take_along_axis(frequencies, lowest, axis=-1), axis=-1, kind='stable'), axis=-1)
+        return {
+            'frequencies': np.take_along_axis(frequencies, lowest, axis=-1),
+            'm': m[lowest],
+            'n': n[lowest]
+        }
+
+    def spurious_mode_mask(self, spectrum, band, intended=((1, 0),)):
+        """True for designs with an unintended mode inside band = (low, high) GHz
+
+        band limits broadcast against the designs. intended lists the (m, n)
+        modes the design is meant to use: the default is linear polarization
+        on TM10; a circularly polarized patch relies on TM10 and TM01.
+        """
+        low, high = (np.asarray(limit, dtype=float)[..., None] for limit in band)
+        wanted = np.zeros(spectrum['m'].shape, dtype=bool)
+        for m, n in intended:
+            wanted |= (spectrum['m'] == m) & (spectrum['n'] == n)
+
+        frequencies = spectrum['frequencies']
+        in_band = (frequencies >= low) & (frequencies <= high) & ~wanted
+        return in_band.any(axis=-1)
+
+    def calculate_feed_map(self, results, nx=200, ny=200, probe_diameter=1.27, n_modes=20):
+        """Input impedance and S11 of a coaxial probe over an (ny, nx) grid on the patch
+
+        Cavity-model modal expansion at the design frequency: the patch,
+        extended by dl on every edge and filled with ereff, is loaded by
+        the radiation Q; the probe is a uniform current ribbon of width
+        probe_diameter (mm). All grid points are evaluated at once as
+        cos²(y modes) · A · cos²(x modes) over n_modes × n_modes modes.
+        x runs across W and y along L, both from the patch corner, at cell
+        centres. Returns the grid, 'Zin' (complex), 'S11' and the best point.
+        """
+        if not get_kernel(results['antenna_type']).rectangular:
+            raise ValueError(f"The feed map covers rectangular patches only, not '{results['antenna_type']}'")
+        f, e, h, Zo = (float(results[key]) for key in ('f', 'e', 'h', 'Zo'))
+        W, L, dl, ereff = (float(results[key]) for key in ('W', 'L', 'dl', 'ereff'))
+        L_e, W_e = L + 2 * dl, W + 2 * dl
+        x = (np.arange(nx) + 0.5) * W / nx
+        y = (np.arange(ny) + 0.5) * L / ny
+
+        f_hz = f * 1e9
+        Q = (c * np.sqrt(ereff)) / (4 * f_hz * h)
+        k2 = ereff * (2 * np.pi * f_hz / c) ** 2 * (1 - 1j / Q)
+        mu0 = 4e-10 * np.pi  # H/mm
+
+        modes = np.arange(n_modes)
+        chi2 = np.where(modes == 0, 1.0, 2.0)
+        kmn2 = (modes[:, None] * np.pi / L_e) ** 2 + (modes[None, :] * np.pi / W_e) ** 2
+        ribbon = (np.sinc(modes * probe_diameter / (2 * L_e))[:, None] *
+                  np.sinc(modes * probe_diameter / (2 * W_e))[None, :]) ** 2
+        A = np.outer(chi2, chi2) * ribbon / (L_e * W_e * (kmn2 - k2))
+
+        Cy2 = np.cos(np.outer(modes, y + dl) * np.pi / L_e) ** 2
+        Cx2 = np.cos(np.outer(modes, x + dl) * np.pi / W_e) ** 2
+        Zin = 1j * (2 * np.pi * f_hz) * mu0 * h * (Cy2.T @ A @ Cx2)
+
+        with np.errstate(divide='ignore'):
+            S11 = 20 * np.log10(np.abs((Zin - Zo) / (Zin + Zo)))
+        iy, ix = np.unravel_index(np.argmin(S11), S11.shape)
+        return {
+            'x': x,
+            'y': y,
+            'Zin': Zin,
+            'S11': S11,
+            'best_x': x[ix],
+            'best_y': y[iy],
+            'best_Zin': Zin[iy, ix],
+            'best_S11': S11[iy, ix]
+        }
+
+    @staticmethod
+    def radiation_q(ereff, h, f):
+        """Radiation quality factor c·sqrt(ereff) / (4 f h) of a patch at f (GHz)"""
+        return (c * np.sqrt(ereff)) / (4 * f * 1e9 * h)
+
+    @staticmethod
+    def parallel_rlc_impedance(R, Q, f, f0):
+        """Impedance of a parallel RLC with resistance R and quality factor Q
+        resonant at f0, at frequency f (same units as f0; broadcasts)"""
+        ratio = f / f0
+        return R / (1 + 1j * Q * (ratio - 1 / ratio))
+
+    def calculate_impedance_sweep(self, results, frequencies):
+        """Input impedance of each design over frequencies (GHz), shape (..., F)
+
+        Near resonance the feed sees a parallel RLC: R is the design's Zin
+        (so S11 at f matches calculate_batch) and Q its radiation Q. Only
+        types with an input-impedance model (a 'Zin' output) are supported.
+        """
+        if 'Zin' not in results:
+            raise ValueError(f"No input impedance model for '{results.get('antenna_type')}'")
+        frequencies = np.asarray(frequencies, dtype=float)
+        f0, Zin = np.asarray(results['f'], dtype=float), np.asarray(results['Zin'], dtype=float)
+        Q = self.radiation_q(np.asarray(results['ereff'], dtype=float),
+                             np.asarray(results['h'], dtype=float), f0)
+        with np.errstate(all='ignore'):
+            return self.parallel_rlc_impedance(Zin[..., None], Q[..., None], frequencies, f0[..., None])
+
+    def calculate_bandwidth(self, results):
+        """Fractional impedance bandwidth (VSWR < 2) of a patch
+
+        Uses the Jackson-Alexopoulos thin-substrate approximation
+        BW = 3.771 * (εr - 1) / εr² * (h / λ0) * (W / L); works on scalar or
+        batch results alike.
+        """
+        e, h, W, L = (np.asarray(results[k], dtype=float) for k in ('e', 'h', 'W', 'L'))
+        wavelength = c / (np.asarray(results['f'], dtype=float) * 1e9)
+        with np.errstate(all='ignore'):
+            return 3.771 * ((e - 1) / e ** 2) * (h / wavelength) * (W / L)
 
     def _calculate_beamwidth(self, pattern, angles):
         """Calculate 3dB beamwidth from normalized pattern"""
@@ -121,36 +419,4 @@ class AntennaCalculator:
 
     def get_structure_coordinates(self, Fi, Wf, W, L, Lg, Wg, dl):
         """Get coordinates for antenna structure plot"""
-        # Ground plane coordinates
-        ground_coords = {
-            'x': [0, Wg, Wg, 0, 0],
-            'y': [0, 0, Lg, Lg, 0]
-        }
-
-        # Patch coordinates (main shape)
-        Ax, Ay = (Wg - W) / 2, (Lg - L) / 2
-        Bx, By = (Wg - 2 * Fi - Wf) / 2, (Lg - L) / 2
-        Cx, Cy = (Wg - 2 * Fi - Wf) / 2, (Lg - L) / 2 + Fi
-        Dx, Dy = (Wg - Wf) / 2, (Lg - L) / 2 + Fi
-        Ex, Ey = (Wg - Wf) / 2, 0
-        Fx, Fy = (Wg + Wf) / 2, 0
-        Gx, Gy = (Wg + Wf) / 2, (Lg - L) / 2 + Fi
-        Hx, Hy = (Wg + Wf) / 2 + Fi, (Lg - L) / 2 + Fi
-        Ix, Iy = (Wg + Wf) / 2 + Fi, (Lg - L) / 2
-        Jx, Jy = (Wg + W) / 2, (Lg - L) / 2
-        Kx, Ky = (Wg + W) / 2, (Lg + L) / 2
-        Lx, Ly = (Wg - W) / 2, (Lg + L) / 2
-
-        patch_coords = {
-            'x': [Ax, Bx, Cx, Dx, Ex, Fx, Gx, Hx, Ix, Jx, Kx, Lx],
-            'y': [Ay, By, Cy, Dy, Ey, Fy, Gy, Hy, Iy, Jy, Ky, Ly]
-        }
-
-        # Extended patch coordinates (with dl)
-        patch_ext_coords = {
-            'x': [Ax, Bx, Cx, Dx, Ex, Fx, Gx, Hx, Ix, Jx, Kx, Lx],
-            'y': [Ay - dl, By - dl, Cy - dl, Dy - dl, Ey, Fy, Gy - dl,
-                  Hy - dl, Iy - dl, Jy - dl, Ky + dl, Ly + dl]
-        }
-
-        return ground_coords, patch_coords, patch_ext_coords
\ No newline at end of file
+        return inset_fed_outline(Fi, Wf, W, L, Lg, Wg, dl)
@@ -0,0 +1,287 @@
+import numpy as np
+
+from .backend import AntennaCalculator
+from .kernels import get_kernel
+
+# Common commercial substrates (name: dielectric constant)
+SUBSTRATES = {
+    'RT/duroid 5880': 2.2,
+    'RT/duroid 5870': 2.33,
+    'RO3003': 3.0,
+    'RO4003C': 3.38,
+    'RO4350B': 3.48,
+    'FR-4': 4.4,
+    'RO3006': 6.15,
+    'RT/duroid 6010': 10.2
+}
+
+# Objective names, all minimized (see DesignSearch.evaluate for their definition):
+#   patch_area    metal area of the patch (mm²), W * L for rectangles
+#   ground_area   Wg * Lg (mm²)
+#   S11           return loss at f (dB), only for types with a matching model
+#   neg_bandwidth negated fractional bandwidth, so that wider is smaller
+OBJECTIVES = ('patch_area', 'ground_area', 'S11', 'neg_bandwidth')
+
+# Default ε-box size per objective. Designs closer than this in every objective
+# are treated as equivalent, which keeps the front to a usable size.
+DEFAULT_RESOLUTION = {
+    'patch_area': 10.0,
+    'ground_area': 10.0,
+    'S11': 0.25,
+    'neg_bandwidth': 5e-4
+}
+
+# Below these sizes pairwise comparison is cheaper than further splitting
+_BRUTE_PAIRS = 1 << 12
+_LEAF_SIZE = 128
+
+
+def _dominated(A, B, d):
+    """Mask of rows of B weakly dominated by some row of A in columns d onwards
+
+    Columns before d must already be resolved (every row of A is <= every row
+    of B there). Divide and conquer on column d: the halves split at the median
+    are solved recursively and the cross term, where column d is then
+    resolved, drops to one dimension fewer. Two remaining columns are solved
+    directly with a sort and a running minimum.
+    """
+    K = A.shape[1]
+    if A.shape[0] == 0 or B.shape[0] == 0:
+        return np.zeros(B.shape[0], dtype=bool)
+
+    if d == K - 1:
+        return A[:, d].min() <= B[:, d]
+
+    if d == K - 2:
+        order = np.argsort(A[:, d], kind='stable')
+        running_min = np.minimum.accumulate(A[order, d + 1])
+        pos = np.searchsorted(A[order, d], B[:, d], side='right')
+        mask = np.zeros(B.shape[0], dtype=bool)
+        hit = pos > 0
+        mask[hit] = running_min[pos[hit] - 1] <= B[hit, d + 1]
+        return mask
+
+    if A.shape[0] * B.shape[0] <= _BRUTE_PAIRS:
+        return np.any(np.all(A[None, :, d:] <= B[:, None, d:], axis=2), axis=1)
+
+    values = np.concatenate([A[:, d], B[:, d]])
+    split = np.partition(values, values.size // 2)[values.size // 2]
+    a_low, b_low = A[:, d] < split, B[:, d] < split
+    if not (a_low.any() or b_low.any()):
+        # Median is the column minimum: split just above it instead
+        split = np.nextafter(split, np.inf)
+        a_low, b_low = A[:, d] < split, B[:, d] < split
+        if a_low.all() and b_low.all():
+            return _dominated(A, B, d + 1)
+
+    mask = np.zeros(B.shape[0], dtype=bool)
+    b_high = ~b_low
+    mask[b_low] = _dominated(A[a_low], B[b_low], d)
+    mask[b_high] = (_dominated(A[~a_low], B[b_high], d) |
+                    _dominated(A[a_low], B[b_high], d + 1))
+    return mask
+
+
+def _front_mask(X):
+    """Non-dominated mask of lexicographically sorted, duplicate-free rows (Kung)"""
+    n = X.shape[0]
+    if n <= _LEAF_SIZE:
+        covered = np.all(X[None, :, :] <= X[:, None, :], axis=2)
+        np.fill_diagonal(covered, False)
+        return ~covered.any(axis=1)
+
+    half = n // 2
+    top, bottom = _front_mask(X[:half]), _front_mask(X[half:])
+    mask = np.concatenate([top, bottom])
+
+    # The top half is never worse in column 0, so only columns 1.. decide
+    idx = np.flatnonzero(bottom) + half
+    mask[idx] = ~_dominated(X[:half][top], X[idx], 1)
+    return mask
+
+
+def pareto_front(objectives):
+    """Indices of the non-dominated rows of an (N, K) objective array
+
+    All objectives are minimized. Exact duplicates are reported once. Uses
+    Kung's divide and conquer, O(N log^(K-1) N), with vectorized base cases.
+    """
+    objectives = np.asarray(objectives, dtype=float)
+    if objectives.shape[0] == 0:
+        return np.array([], dtype=int)
+
+    order = np.lexsort(objectives.T[::-1])
+    ordered = objectives[order]
+    unique = np.ones(ordered.shape[0], dtype=bool)
+    unique[1:] = np.any(ordered[1:] != ordered[:-1], axis=1)
+
+    idx = np.flatnonzero(unique)
+    return np.sort(order[idx[_front_mask(ordered[idx])]])
+
+
+def _group_rows(rows, *tiebreak):
+    """Sort order of rows (ties broken by tiebreak keys) and group id per row"""
+    order = np.lexsort(tiebreak + tuple(rows.T[::-1]))
+    starts = np.ones(rows.shape[0], dtype=bool)
+    starts[1:] = np.any(rows[order[1:]] != rows[order[:-1]], axis=1)
+    group = np.empty(rows.shape[0], dtype=int)
+    group[order] = np.cumsum(starts) - 1
+    return order, starts, group
+
+
+def dominated_by(candidates, front):
+    """Mask of candidates weakly dominated by (or equal to) any row of front"""
+    candidates = np.asarray(candidates, dtype=float)
+    front = np.asarray(front, dtype=float).reshape(-1, candidates.shape[1])
+    return _dominated(front, candidates, 0)
+
+
+class DesignSearch:
+    """Multi-objective search over substrates and feed parameters"""
+
+    def __init__(self, f, antenna_type="Microstrip Patch Antenna (Inset-Fed)", calculator=None):
+        self.f = f
+        self.antenna_type = antenna_type
+        self.calculator = calculator or AntennaCalculator()
+
+        # Types without a matching model drop the S11 objective
+        self.kernel = get_kernel(antenna_type)
+        outputs = self.kernel.outputs
+        self.objective_names = tuple(name for name in OBJECTIVES
+                                     if name != 'S11' or 'S11' in outputs)
+
+    def evaluate(self, e, t, h, Zo):
+        """Batch-evaluate candidates and return (results, objectives, valid)"""
+        calc = self.calculator
+        results = calc.calculate_batch(self.f, e, t, h, Zo, self.antenna_type, validate=True)
+
+        with np.errstate(all='ignore'):
+            columns = {
+                'patch_area': self.kernel.patch_area(results),
+                'ground_area': results['Wg'] * results['Lg'],
+                'S11': results.get('S11'),
+                'neg_bandwidth': -calc.calculate_bandwidth(results)
+            }
+            objectives = np.column_stack([columns[name] for name in self.objective_names])
+
+        valid = results['status'] & np.all(np.isfinite(objectives), axis=1)
+        return results, objectives, valid
+
+    def _grid_chunks(self, axes, chunk_size):
+        """Yield (e, t, h, Zo) chunks of the full-factorial grid without building it"""
+        sizes = [len(a) for a in axes]
+        total = int(np.prod(sizes))
+        for start in range(0, total, chunk_size):
+            idx = np.unravel_index(np.arange(start, min(start + chunk_size, total)), sizes)
+            yield tuple(a[i] for a, i in zip(axes, idx))
+
+    def _random_chunks(self, axes, n_samples, chunk_size, seed):
+        """Yield uniformly sampled (e, t, h, Zo) chunks within each axis' range"""
+        rng = np.random.default_rng(seed)
+        for start in range(0, n_samples, chunk_size):
+            n = min(chunk_size, n_samples - start)
+            yield tuple(rng.uniform(a.min(), a.max(), n) if a.size > 1 else np.full(n, a[0])
+                        for a in axes)
+
+    def _boxes(self, objectives, resolution):
+        """ε-box coordinates and in-box ranking of each objective row"""
+        if resolution is None:
+            return objectives, np.zeros(objectives.shape[0])
+        scaled = objectives / resolution
+        boxes = np.floor(scaled)
+        return boxes, (scaled - boxes).sum(axis=1)
+
+    def search(self, e_values, h_values, t_values=(0.035,), Zo_values=(50.0,),
+               n_samples=None, chunk_size=250_000, seed=None, resolution='default',
+               progress=None):
+        """Return the Pareto front over all candidate designs
+
+        With n_samples=None the full grid of the given values is evaluated;
+        otherwise n_samples random designs are drawn within their ranges.
+
+        Objectives are compared on an ε-box grid (DEFAULT_RESOLUTION, or a
+        dict of per-objective box sizes); one representative design is kept
+        per non-dominated box. Pass resolution=None for the exact front.
+
+        Candidates are processed in chunks. Each chunk is reduced to its best
+        design per box, culled against the running front, sorted on its own,
+        and only then merged: front entries the newcomers dominate are
+        dropped without re-sorting the front.
+        """
+        axes = [np.atleast_1d(np.asarray(v, dtype=float)) for v in (e_values, t_values, h_values, Zo_values)]
+        if n_samples is None:
+            total = int(np.prod([a.size for a in axes]))
+            chunks = self._grid_chunks(axes, chunk_size)
+        else:
+            total = int(n_samples)
+            chunks = self._random_chunks(axes, total, chunk_size, seed)
+
+        if resolution == 'default':
+            resolution = DEFAULT_RESOLUTION
+        if resolution is not None:
+            resolution = np.array([resolution[name] for name in self.objective_names], dtype=float)
+
+        K = len(self.objective_names)
+        front_box, front_rank = np.empty((0, K)), np.empty(0)
+        front_obj, front_params = np.empty((0, K)), np.empty((0, 4))
+        evaluated = 0
+
+        for e, t, h, Zo in chunks:
+            evaluated += e.size
+            _, objectives, valid = self.evaluate(e, t, h, Zo)
+            params = np.column_stack([e, t, h, Zo])[valid]
+            objectives = objectives[valid]
+            boxes, rank = self._boxes(objectives, resolution)
+
+            # Best design per box within the chunk
+            order, starts, _ = _group_rows(boxes, rank)
+            keep = order[starts]
+            boxes, rank, objectives, params = boxes[keep], rank[keep], objectives[keep], params[keep]
+
+            # Boxes already on the front: keep whichever design sits deeper in the box
+            _, starts, group = _group_rows(np.vstack([front_box, boxes]))
+            slot = np.full(starts.sum(), -1)
+            slot[group[:front_box.shape[0]]] = np.arange(front_box.shape[0])
+            match = slot[group[front_box.shape[0]:]]
+            shared = match >= 0
+            better = shared.copy()
+            better[shared] = rank[shared] < front_rank[match[shared]]
+            front_rank[match[better]] = rank[better]
+            front_obj[match[better]] = objectives[better]
+            front_params[match[better]] = params[better]
+
+            new = ~shared
+            boxes, rank, objectives, params = boxes[new], rank[new], objectives[new], params[new]
+
+            # Cull against the running front, then sort the survivors alone
+            survivors = ~dominated_by(boxes, front_box)
+            survivors[survivors] = np.isin(np.arange(survivors.sum()), pareto_front(boxes[survivors]))
+            boxes, rank, objectives, params = (boxes[survivors], rank[survivors],
+                                               objectives[survivors], params[survivors])
+
+            # Drop front entries the newcomers dominate and append them
+            stay = ~dominated_by(front_box, boxes)
+            front_box = np.vstack([front_box[stay], boxes])
+            front_rank = np.concatenate([front_rank[stay], rank])
+            front_obj = np.vstack([front_obj[stay], objectives])
+            front_params = np.vstack([front_params[stay], params])
+
+            if progress is not None:
+                progress(evaluated, total)
+
+        # Present the front ordered by the first objective
+        order = np.argsort(front_obj[:, 0], kind='stable')
+        front_obj, front_params = front_obj[order], front_params[order]
+
+        e, t, h, Zo = front_params.T
+        return {
+            'e': e,
+            't': t,
+            'h': h,
+            'Zo': Zo,
+            'objectives': front_obj,
+            'objective_names': self.objective_names,
+            'results': self.calculator.calculate_batch(self.f, e, t, h, Zo, self.antenna_type),
+            'bandwidth': -front_obj[:, self.objective_names.index('neg_bandwidth')],
+            'evaluated': evaluated
+        }
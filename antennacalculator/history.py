@@ -0,0 +1,181 @@
+import os
+import struct
+import time
+
+import numpy as np
+
+# File layout: MAGIC, then records of <kind:1s><length:uint32><payload>.
+#   b'S' schema:  <id:uint16><type:str16><n:uint16><key:str16 * n>
+#   b'D' design:  <schema id:uint16><timestamp:float64><value:float64 * n>
+# Schemas are written once per (antenna type, result keys) combination, so a
+# design record is just its numbers.
+MAGIC = b'PATCHHIST1\n'
+_HEADER = struct.Struct('<cI')
+_DESIGN = struct.Struct('<Hd')
+
+
+def default_history_path():
+    """Per-user history file location"""
+    return os.path.join(os.path.expanduser('~'), '.antennacalculator', 'history.bin')
+
+
+def _pack_str(text):
+    data = text.encode('utf-8')
+    return struct.pack('<H', len(data)) + data
+
+
+def _unpack_str(buffer, offset):
+    (size,) = struct.unpack_from('<H', buffer, offset)
+    offset += 2
+    return buffer[offset:offset + size].decode('utf-8'), offset + size
+
+
+class DesignHistory:
+    """Append-only binary log of calculated designs with an in-memory index
+
+    Every numeric result is stored, so a past design can be shown again
+    without recomputation. The whole log is indexed on open; values live in
+    one growing float64 array per schema, and each entry is a (schema, row)
+    pair, so recall and comparison never touch the disk.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or default_history_path()
+        self._schemas = []          # [(antenna_type, keys)]
+        self._schema_ids = {}       # (antenna_type, keys) -> id
+        self._values = []           # per schema: float64 array (capacity, n_keys)
+        self._rows = []             # per schema: used rows
+        self._entry_schema = []
+        self._entry_row = []
+        self._timestamps = []
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, 'rb') as handle:
+            buffer = handle.read()
+        if not buffer.startswith(MAGIC):
+            raise ValueError(f"Not a design history file: {self.path}")
+
+        offset, end = len(MAGIC), len(buffer)
+        while offset + _HEADER.size <= end:
+            kind, length = _HEADER.unpack_from(buffer, offset)
+            start = offset + _HEADER.size
+            if start + length > end:
+                break  # torn final record from an interrupted write
+
+            if kind == b'S':
+                (schema_id,) = struct.unpack_from('<H', buffer, start)
+                antenna_type, pos = _unpack_str(buffer, start + 2)
+                (n_keys,) = struct.unpack_from('<H', buffer, pos)
+                pos += 2
+                keys = []
+                for _ in range(n_keys):
+                    key, pos = _unpack_str(buffer, pos)
+                    keys.append(key)
+                self._register_schema(antenna_type, tuple(keys), schema_id)
+
+            elif kind == b'D':
+                schema_id, timestamp = _DESIGN.unpack_from(buffer, start)
+                values = np.frombuffer(buffer, dtype='<f8', offset=start + _DESIGN.size,
+                                       count=(length - _DESIGN.size) // 8)
+                self._add_entry(schema_id, timestamp, values)
+
+            offset = start + length
+
+        # Drop a torn tail so the next append starts on a record boundary
+        if offset != end:
+            with open(self.path, 'r+b') as handle:
+                handle.truncate(offset)
+
+    def _register_schema(self, antenna_type, keys, schema_id=None):
+        schema_id = len(self._schemas) if schema_id is None else schema_id
+        self._schemas.append((antenna_type, keys))
+        self._schema_ids[(antenna_type, keys)] = schema_id
+        self._values.append(np.empty((16, len(keys))))
+        self._rows.append(0)
+        return schema_id
+
+    def _add_entry(self, schema_id, timestamp, values):
+        table, row = self._values[schema_id], self._rows[schema_id]
+        if row == table.shape[0]:
+            table = np.resize(table, (2 * row, table.shape[1]))
+            self._values[schema_id] = table
+        table[row] = values
+        self._rows[schema_id] = row + 1
+
+        self._entry_schema.append(schema_id)
+        self._entry_row.append(row)
+        self._timestamps.append(timestamp)
+        return len(self._timestamps) - 1
+
+    def _write(self, kind, payload):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        new_file = not os.path.exists(self.path)
+        with open(self.path, 'ab') as handle:
+            if new_file:
+                handle.write(MAGIC)
+            handle.write(_HEADER.pack(kind, len(payload)) + payload)
+
+    def append(self, results):
+        """Record a result dict from calculate_parameters; returns its index"""
+        antenna_type = results.get('antenna_type', '')
+        keys = tuple(key for key, value in results.items()
+                     if key != 'antenna_type' and np.ndim(value) == 0 and
+                     isinstance(value, (int, float, np.number)))
+
+        schema_id = self._schema_ids.get((antenna_type, keys))
+        if schema_id is None:
+            schema_id = self._register_schema(antenna_type, keys)
+            payload = struct.pack('<H', schema_id) + _pack_str(antenna_type)
+            payload += struct.pack('<H', len(keys)) + b''.join(_pack_str(k) for k in keys)
+            self._write(b'S', payload)
+
+        timestamp = time.time()
+        values = np.array([results[key] for key in keys], dtype='<f8')
+        self._write(b'D', _DESIGN.pack(schema_id, timestamp) + values.tobytes())
+        return self._add_entry(schema_id, timestamp, values)
+
+    def __len__(self):
+        return len(self._timestamps)
+
+    def __getitem__(self, index):
+        """Stored result dict of entry index (negative indices count from the end)"""
+        index = range(len(self))[index]
+        antenna_type, keys = self._schemas[self._entry_schema[index]]
+        row = self._values[self._entry_schema[index]][self._entry_row[index]]
+        results = dict(zip(keys, row.tolist()))
+        results['antenna_type'] = antenna_type
+        return results
+
+    def timestamp(self, index):
+        return self._timestamps[index]
+
+    def antenna_type(self, index):
+        return self._schemas[self._entry_schema[index]][0]
+
+    def value(self, index, key, default=float('nan')):
+        """Single stored value without building the whole result dict"""
+        _, keys = self._schemas[self._entry_schema[index]]
+        if key not in keys:
+            return default
+        return float(self._values[self._entry_schema[index]][self._entry_row[index], keys.index(key)])
+
+    def compare(self, indices, keys=None):
+        """Side-by-side values for several entries
+
+        Returns (keys, table) where table[i][j] is keys[i] of entry indices[j],
+        NaN where an entry's antenna type has no such output. Without keys,
+        the union of the entries' outputs is used in first-seen order.
+        """
+        designs = [self[i] for i in indices]
+        if keys is None:
+            keys = []
+            for design in designs:
+                keys.extend(k for k in design if k != 'antenna_type' and k not in keys)
+        table = [[design.get(key, float('nan')) for design in designs] for key in keys]
+        return keys, table
@@ -0,0 +1,384 @@
+import numpy as np
+
+from .templates import ReportTemplate
+from .validation import ERR_CONVERGENCE, ERR_FEED_WIDTH, ERR_MATCH, flag
+
+c = 299792458000  # mm/s
+
+# Registered kernels, keyed by the antenna type name shown in the GUI
+KERNELS = {}
+
+# Entry-point group third-party packages use to register antenna types
+PLUGIN_GROUP = 'antennacalculator.kernels'
+
+
+class AntennaKernel:
+    """One antenna type: outputs, vectorized model, geometry and report
+
+    Subclasses set name and outputs and implement compute(). compute()
+    receives the common patch results (W, L, ereff, dl, ... as arrays) and
+    returns the type-specific outputs as arrays of the same shape.
+    """
+    name = None
+    outputs = ()
+    # Probe-fed types get a feed-position impedance map in the structure view
+    probe_fed = False
+    # Rectangular W x L patches; the Jacobian and tolerance models assume this
+    rectangular = True
+
+    def compute(self, base):
+        raise NotImplementedError
+
+    def validate(self, results):
+        """Error codes (validation.ERR_* flags) of the type-specific outputs"""
+        return 0
+
+    def patch_area(self, results):
+        """Metal area of the patch (mm²)"""
+        return results['W'] * results['L']
+
+    def geometry(self, results):
+        """Outline coordinates for StructurePlot, or None if not drawable"""
+        return None
+
+    # ReportTemplates of the parameters and summary texts
+    parameters_template = None
+    summary_template = None
+
+    def report(self, results):
+        """(parameters text, summary text) for the results panel"""
+        return self.parameters_template.render(results), self.summary_template.render(results)
+
+    def report_columns(self, batch):
+        """report() for every row of 1-D batch results, as two lists of texts"""
+        return (self.parameters_template.render_columns(batch),
+                self.summary_template.render_columns(batch))
+
+
+def register_kernel(kernel):
+    """Add an AntennaKernel class or instance to the registry (usable as a decorator)"""
+    instance = kernel() if isinstance(kernel, type) else kernel
+    if not instance.name:
+        raise ValueError("Antenna kernels need a name")
+    KERNELS[instance.name] = instance
+    return kernel
+
+
+def get_kernel(antenna_type):
+    try:
+        return KERNELS[antenna_type]
+    except KeyError:
+        raise ValueError(f"Unknown antenna type '{antenna_type}'. Available: {', '.join(KERNELS)}")
+
+
+def load_plugins():
+    """Register kernels advertised by installed packages under PLUGIN_GROUP"""
+    from importlib.metadata import entry_points
+
+    for entry_point in entry_points(group=PLUGIN_GROUP):
+        register_kernel(entry_point.load())
+
+
+def inset_fed_outline(Fi, Wf, W, L, Lg, Wg, dl):
+    """Ground, patch and fringing-extended patch outlines of an inset-fed patch"""
+    # Ground plane coordinates
+    ground_coords = {
+        'x': [0, Wg, Wg, 0, 0],
+        'y': [0, 0, Lg, Lg, 0]
+    }
+
+    # Patch coordinates (main shape)
+    Ax, Ay = (Wg - W) / 2, (Lg - L) / 2
+    Bx, By = (Wg - 2 * Fi - Wf) / 2, (Lg - L) / 2
+    Cx, Cy = (Wg - 2 * Fi - Wf) / 2, (Lg - L) / 2 + Fi
+    Dx, Dy = (Wg - Wf) / 2, (Lg - L) / 2 + Fi
+    Ex, Ey = (Wg - Wf) / 2, 0
+    Fx, Fy = (Wg + Wf) / 2, 0
+    Gx, Gy = (Wg + Wf) / 2, (Lg - L) / 2 + Fi
+    Hx, Hy = (Wg + Wf) / 2 + Fi, (Lg - L) / 2 + Fi
+    Ix, Iy = (Wg + Wf) / 2 + Fi, (Lg - L) / 2
+    Jx, Jy = (Wg + W) / 2, (Lg - L) / 2
+    Kx, Ky = (Wg + W) / 2, (Lg + L) / 2
+    Lx, Ly = (Wg - W) / 2, (Lg + L) / 2
+
+    patch_coords = {
+        'x': [Ax, Bx, Cx, Dx, Ex, Fx, Gx, Hx, Ix, Jx, Kx, Lx],
+        'y': [Ay, By, Cy, Dy, Ey, Fy, Gy, Hy, Iy, Jy, Ky, Ly]
+    }
+
+    # Extended patch coordinates (with dl)
+    patch_ext_coords = {
+        'x': [Ax, Bx, Cx, Dx, Ex, Fx, Gx, Hx, Ix, Jx, Kx, Lx],
+        'y': [Ay - dl, By - dl, Cy - dl, Dy - dl, Ey, Fy, Gy - dl,
+              Hy - dl, Iy - dl, Jy - dl, Ky + dl, Ly + dl]
+    }
+
+    return ground_coords, patch_coords, patch_ext_coords
+
+
+def rectangular_outline(W, L, Lg, Wg, dl):
+    """Ground, patch and fringing-extended patch outlines of a plain rectangular patch"""
+    ground_coords = {
+        'x': [0, Wg, Wg, 0, 0],
+        'y': [0, 0, Lg, Lg, 0]
+    }
+    x0, y0 = (Wg - W) / 2, (Lg - L) / 2
+    patch_coords = {
+        'x': [x0, x0 + W, x0 + W, x0],
+        'y': [y0, y0, y0 + L, y0 + L]
+    }
+    patch_ext_coords = {
+        'x': [x0, x0 + W, x0 + W, x0],
+        'y': [y0 - dl, y0 - dl, y0 + L + dl, y0 + L + dl]
+    }
+    return ground_coords, patch_coords, patch_ext_coords
+
+
+def _match_note(results):
+    good = np.asarray(results.get('VSWR', 0)) < 2
+    return np.where(good, '✓ Good matching (VSWR < 2)', '⚠ Poor matching (VSWR ≥ 2)')
+
+
+@register_kernel
+class InsetFedKernel(AntennaKernel):
+    name = "Microstrip Patch Antenna (Inset-Fed)"
+    outputs = ('Fi', 'Wf', 'S11', 'VSWR', 'Rin', 'Zin')
+
+    def compute(self, base):
+        e, h, t, Zo, W, L = (base[key] for key in ('e', 'h', 't', 'Zo', 'W', 'L'))
+        Fi = ((10 ** -4) * ((0.001699 * e ** 7) + (0.13761 * e ** 6) - (6.1783 * e ** 5) +
+                            (93.187 * e ** 4) - (682.69 * e ** 3) + (2561.9 * e ** 2) -
+                            (4043 * e) + 6697) * (L / 2)) * 0.83477
+        Wf = ((7.48 * h) / (np.e ** (Zo * ((np.sqrt(e + 1.41)) / 87)))) - (1.25 * t)
+        Rin = W ** 2 / (1.5 * e)
+        Zin = Zo / (1 + (Zo / Rin))
+        Γ = (Zin - Zo) / (Zin + Zo)
+        S11 = 20 * np.log10(np.abs(Γ))
+        VSWR = (1 + np.abs(Γ)) / (1 - np.abs(Γ))
+
+        return {
+            'Fi': Fi,
+            'Wf': Wf,
+            'S11': S11,
+            'VSWR': VSWR,
+            'Rin': Rin,
+            'Zin': Zin
+        }
+
+    def validate(self, results):
+        match = np.isfinite(results['S11']) & np.isfinite(results['VSWR'])
+        return flag(~(results['Wf'] > 0), ERR_FEED_WIDTH) | flag(~match, ERR_MATCH)
+
+    def geometry(self, results):
+        return inset_fed_outline(results['Fi'], results['Wf'], results['W'], results['L'],
+                                 results['Lg'], results['Wg'], results['dl'])
+
+    parameters_template = ReportTemplate("""╔══════════════════════════════════════════════════════╗
+║           MICROSTRIP PATCH ANTENNA DESIGN            ║
+╚══════════════════════════════════════════════════════╝
+
+📡 OPERATING PARAMETERS
+  • Frequency (f)          : {f:.4f} GHz
+  • Dielectric Const (εr)  : {e:.4f}
+  • Conductor Height (t)   : {t:.4f} mm
+  • Substrate Height (h)   : {h:.4f} mm
+
+📏 PATCH DIMENSIONS
+  • Patch Width (W)        : {W:.4f} mm
+  • Patch Length (L)       : {L:.4f} mm
+  • Ground Width (Wg)      : {Wg:.4f} mm
+  • Ground Length (Lg)     : {Lg:.4f} mm
+
+🔌 FEED PARAMETERS
+  • Inset Length (Fi)      : {Fi:.4f} mm
+  • Feed Line Width (Wf)   : {Wf:.4f} mm
+
+⚡ PERFORMANCE METRICS
+  • S11 Parameter          : {S11:.4f} dB
+  • VSWR                   : {VSWR:.4f}
+  • Input Impedance (Zin)  : {Zin:.4f} Ω
+  • Radiation Res. (Rin)   : {Rin:.4f} Ω
+
+🔬 DERIVED PARAMETERS
+  • Effective εr (εreff)   : {ereff:.4f}
+  • Effective Length (Leff): {leff:.4f} mm
+  • Fringing Ext. (ΔL)     : {dl:.4f} mm
+""")
+    summary_template = ReportTemplate("""Design Summary for {f:.2f} GHz Microstrip Patch Antenna
+============================================================
+
+The antenna has been designed with a patch size of {W:.2f} × {L:.2f} mm
+on a substrate with εr = {e:.2f} and height = {h:.2f} mm.
+
+Feed Configuration:
+  - Inset-fed microstrip line with Fi = {Fi:.2f} mm
+  - Feed line width Wf = {Wf:.2f} mm (for {Zo:.0f}Ω impedance)
+
+Performance:
+  - Return Loss (S11): {S11:.2f} dB
+  - VSWR: {VSWR:.2f}:1
+  {match_note}
+
+Recommended ground plane: {Wg:.2f} × {Lg:.2f} mm
+""", derived={'match_note': _match_note})
+
+
+@register_kernel
+class CoaxialFeedKernel(AntennaKernel):
+    name = "Coaxial Feed Patch Antenna (Beta)"
+    outputs = ('Xf', 'Yf')
+    probe_fed = True
+
+    def compute(self, base):
+        L, W, ereff = base['L'], base['W'], base['ereff']
+        return {
+            'Xf': L / (2 * np.sqrt(ereff)),
+            'Yf': W / (3 * np.sqrt(ereff))
+        }
+
+    def geometry(self, results):
+        return rectangular_outline(results['W'], results['L'], results['Lg'], results['Wg'],
+                                   results['dl'])
+
+    parameters_template = ReportTemplate("""Operating Frequency (f)   : {f:.4f} GHz
+Dielectric Constant (εr)  : {e:.4f}
+Conductor Height (t)      : {t:.4f} mm
+Substrate Height (h)      : {h:.4f} mm
+Patch Width (W)           : {W:.4f} mm
+Patch Length (L)          : {L:.4f} mm
+Ground Width (Wg)         : {Wg:.4f} mm
+Ground Length (Lg)        : {Lg:.4f} mm
+Feed Point Xf             : {Xf:.4f} mm
+Feed Point Yf             : {Yf:.4f} mm""")
+    summary_template = ReportTemplate("Coaxial feed antenna design completed.")
+
+
+@register_kernel
+class CircularlyPolarizedKernel(AntennaKernel):
+    name = "Circularly Polarized Antennas (Beta)"
+    outputs = ('a', 'Q')
+
+    def compute(self, base):
+        f_hz = base['f'] * 1e9
+        Q = (c * np.sqrt(base['ereff'])) / (4 * f_hz * base['h'])
+        return {
+            'a': base['L'] * np.sqrt(1 / (2 * Q)),
+            'Q': Q
+        }
+
+    parameters_template = ReportTemplate("""Operating Frequency (f)   : {f:.4f} GHz
+Dielectric Constant (εr)  : {e:.4f}
+Conductor Height (t)      : {t:.4f} mm
+Substrate Height (h)      : {h:.4f} mm
+Patch Width (W)           : {W:.4f} mm
+Patch Length (L)          : {L:.4f} mm
+Ground Width (Wg)         : {Wg:.4f} mm
+Ground Length (Lg)        : {Lg:.4f} mm
+Corner Trunc Size (a)     : {a:.4f} mm
+Quality Factor (Q)        : {Q:.4f}""")
+    summary_template = ReportTemplate("Circularly polarized antenna design completed.")
+
+
+def solve_circular_radius(f, e, h, tol=1e-12, max_iter=50):
+    """Physical radius of circular patches resonating in TM11 at f (GHz)
+
+    The fringing-corrected effective radius
+        ae = a * sqrt(1 + 2h / (π a εr) * (ln(π a / 2h) + 1.7726))
+    must equal the cavity radius 1.8412 c / (2π f sqrt(εr)). The fixed point
+    a = ae_target / sqrt(1 + q(a)) is iterated on whole arrays; each element
+    stops once its relative update is below tol, so only unconverged ones
+    are recomputed. Elements whose update turns non-finite stop as well but
+    are not converged. Returns (a, ae, iterations, converged).
+    """
+    f, e, h = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (f, e, h)))
+    shape = f.shape
+    f, e, h = f.ravel(), e.ravel(), h.ravel()
+
+    def fringing(a, e, h):
+        return 1 + (2 * h / (np.pi * a * e)) * (np.log(np.pi * a / (2 * h)) + 1.7726)
+
+    with np.errstate(all='ignore'):
+        target = 1.8412 * c / (2 * np.pi * f * 1e9 * np.sqrt(e))
+        a = target.copy()
+        iterations = np.zeros(f.shape, dtype=np.int64)
+        converged = np.zeros(f.shape, dtype=bool)
+        active = np.flatnonzero(np.isfinite(target) & (h > 0))
+
+        for _ in range(max_iter):
+            if active.size == 0:
+                break
+            updated = target[active] / np.sqrt(fringing(a[active], e[active], h[active]))
+            finite = np.isfinite(updated)
+            done = finite & (np.abs(updated - a[active]) <= tol * np.abs(updated))
+            a[active] = updated
+            iterations[active] += 1
+            converged[active[done]] = True
+            active = active[finite & ~done]
+
+        ae = a * np.sqrt(fringing(a, e, h))
+
+    return (a.reshape(shape), ae.reshape(shape), iterations.reshape(shape),
+            converged.reshape(shape))
+
+
+def circular_outline(R, Re, Lg, Wg, points=181):
+    """Ground, patch and fringing-extended (effective radius) outlines of a circular patch"""
+    ground_coords = {
+        'x': [0, Wg, Wg, 0, 0],
+        'y': [0, 0, Lg, Lg, 0]
+    }
+    angle = np.linspace(0, 2 * np.pi, points)
+    patch_coords = {
+        'x': list(Wg / 2 + R * np.cos(angle)),
+        'y': list(Lg / 2 + R * np.sin(angle))
+    }
+    patch_ext_coords = {
+        'x': list(Wg / 2 + Re * np.cos(angle)),
+        'y': list(Lg / 2 + Re * np.sin(angle))
+    }
+    return ground_coords, patch_coords, patch_ext_coords
+
+
+@register_kernel
+class CircularPatchKernel(AntennaKernel):
+    name = "Circular Patch Antenna"
+    outputs = ('R', 'Re', 'radius_iterations', 'radius_converged')
+    rectangular = False
+
+    def compute(self, base):
+        f, e, h = base['f'], base['e'], base['h']
+        R, Re, iterations, converged = solve_circular_radius(f, e, h)
+        # W, L and the ground plane describe the bounding square of the disc
+        return {
+            'R': R,
+            'Re': Re,
+            'radius_iterations': iterations,
+            'radius_converged': converged,
+            'W': 2 * R,
+            'L': 2 * R,
+            'Wg': 2 * R + 6 * h,
+            'Lg': 2 * R + 6 * h,
+            'dl': Re - R,
+            'ereff': e,
+            'leff': 2 * Re
+        }
+
+    def validate(self, results):
+        return flag(~results['radius_converged'], ERR_CONVERGENCE)
+
+    def patch_area(self, results):
+        return np.pi * results['R'] ** 2
+
+    def geometry(self, results):
+        return circular_outline(results['R'], results['Re'], results['Lg'], results['Wg'])
+
+    parameters_template = ReportTemplate("""Operating Frequency (f)   : {f:.4f} GHz
+Dielectric Constant (εr)  : {e:.4f}
+Conductor Height (t)      : {t:.4f} mm
+Substrate Height (h)      : {h:.4f} mm
+Patch Radius (a)          : {R:.4f} mm
+Effective Radius (ae)     : {Re:.4f} mm
+Ground Width (Wg)         : {Wg:.4f} mm
+Ground Length (Lg)        : {Lg:.4f} mm
+Radius Solver Iterations  : {radius_iterations:.0f}""")
+    summary_template = ReportTemplate("Circular patch antenna design completed.")
@@ -0,0 +1,351 @@
+import numpy as np
+
+from .backend import c
+
+# Amplitude tapers (normalized to a peak of 1) indexed by name
+TAPERS = {
+    'uniform': lambda n: np.ones(n),
+    'cosine': lambda n: np.sin(np.pi * (np.arange(n) + 0.5) / n),
+    'hann': lambda n: np.hanning(n + 2)[1:-1] / np.hanning(n + 2)[1:-1].max(),
+    'hamming': lambda n: np.hamming(n) / np.hamming(n).max(),
+    'triangular': lambda n: 1 - np.abs((np.arange(n) - (n - 1) / 2) / ((n + 1) / 2)),
+}
+
+# Half-power level used for beamwidths (same convention as the backend)
+HALF_POWER = 0.707
+
+# Samples per expected half-power beamwidth on the cut and on the hemisphere grid
+CUT_SAMPLES_PER_BEAM = 40
+GRID_SAMPLES_PER_BEAM = 8
+
+# Hemisphere points evaluated at once when integrating the radiated power
+GRID_BLOCK = 1 << 15
+
+# numpy < 2.0 only provides trapz
+_trapezoid = getattr(np, 'trapezoid', None) or np.trapz
+
+
+class PatchArray:
+    """Planar N x M array of identical patch elements"""
+
+    def __init__(self, element_results, nx=4, ny=4, dx=None, dy=None,
+                 taper_x='uniform', taper_y='uniform', theta0=0.0, phi0=0.0):
+        self.element = element_results
+        self.f_hz = element_results['f'] * 1e9
+        self.wavelength = c / self.f_hz
+        self.k = 2 * np.pi / self.wavelength
+
+        self.nx, self.ny = int(nx), int(ny)
+        if self.nx < 1 or self.ny < 1:
+            raise ValueError("Array must have at least one element per axis")
+
+        # Half-wavelength spacing unless specified (mm)
+        self.dx = 0.5 * self.wavelength if dx is None else dx
+        self.dy = 0.5 * self.wavelength if dy is None else dy
+
+        # Element positions along each axis, centred on the origin
+        self.x = (np.arange(self.nx) - (self.nx - 1) / 2) * self.dx
+        self.y = (np.arange(self.ny) - (self.ny - 1) / 2) * self.dy
+
+        self.ax = self._taper(taper_x, self.nx)
+        self.ay = self._taper(taper_y, self.ny)
+
+        self.theta0 = theta0
+        self.phi0 = phi0
+
+    def _taper(self, taper, n):
+        """Resolve a taper name or explicit amplitude vector"""
+        if isinstance(taper, str):
+            if taper not in TAPERS:
+                raise ValueError(f"Unknown taper '{taper}'. Available: {', '.join(TAPERS)}")
+            return TAPERS[taper](n).astype(float)
+
+        taper = np.asarray(taper, dtype=float)
+        if taper.shape != (n,):
+            raise ValueError(f"Taper must have {n} values, got shape {taper.shape}")
+        return taper
+
+    @staticmethod
+    def _direction_cosines(theta, phi):
+        """Direction cosines (u, v) for angles in degrees"""
+        theta, phi = np.radians(theta), np.radians(phi)
+        return np.sin(theta) * np.cos(phi), np.sin(theta) * np.sin(phi)
+
+    def _steering_weights(self, theta0, phi0):
+        """Complex per-axis weights for one or more scan directions
+
+        Returns arrays of shape (S, nx) and (S, ny) for S scan angles.
+        """
+        u0, v0 = self._direction_cosines(np.atleast_1d(theta0), np.atleast_1d(phi0))
+        wx = self.ax * np.exp(-1j * self.k * u0[:, None] * self.x[None, :])
+        wy = self.ay * np.exp(-1j * self.k * v0[:, None] * self.y[None, :])
+        return wx, wy
+
+    def _axis_phases(self, u, v):
+        """Per-element phase terms for flat (P,) direction cosines"""
+        ex = np.exp(1j * self.k * self.x[:, None] * u[None, :])
+        ey = np.exp(1j * self.k * self.y[:, None] * v[None, :])
+        return ex, ey
+
+    @staticmethod
+    def _array_factor(phases, wx, wy):
+        """Separable array factor for (S, n) weights
+
+        The double sum over elements factorises into one matrix product per
+        axis, so the cost is O(S * P * (nx + ny)) rather than O(S * P * nx * ny).
+        """
+        ex, ey = phases
+        return (wx @ ex) * (wy @ ey)
+
+    def array_factor(self, theta, phi, normalize=True):
+        """Array factor magnitude for broadcastable theta/phi grids (degrees)"""
+        theta, phi = np.broadcast_arrays(np.asarray(theta, dtype=float),
+                                         np.asarray(phi, dtype=float))
+        u, v = self._direction_cosines(theta.ravel(), phi.ravel())
+        wx, wy = self._steering_weights(self.theta0, self.phi0)
+        af = np.abs(self._array_factor(self._axis_phases(u, v), wx, wy)[0]).reshape(theta.shape)
+        if normalize:
+            af = af / (self.ax.sum() * self.ay.sum())
+        return af
+
+    def element_pattern(self, theta, phi):
+        """Normalized far-field magnitude of a single patch (cavity model)
+
+        The patch resonates along x (length L) and radiates through two slots
+        of width W separated by the effective length. The lower hemisphere is
+        treated as blocked by the ground plane.
+        """
+        theta_r = np.radians(np.asarray(theta, dtype=float))
+        phi_r = np.radians(np.asarray(phi, dtype=float))
+        W, leff = self.element['W'], self.element['leff']
+
+        X = 0.5 * self.k * W * np.sin(theta_r) * np.sin(phi_r)
+        Z = 0.5 * self.k * leff * np.sin(theta_r) * np.cos(phi_r)
+        slot = np.sinc(X / np.pi) * np.cos(Z)
+        polarization = np.sqrt(np.cos(phi_r) ** 2 + (np.cos(theta_r) * np.sin(phi_r)) ** 2)
+
+        pattern = np.abs(slot) * polarization
+        return np.where(np.cos(theta_r) >= 0, pattern, 0.0)
+
+    def total_pattern(self, theta, phi, normalize=True):
+        """Element pattern multiplied by the array factor"""
+        pattern = self.element_pattern(theta, phi) * self.array_factor(theta, phi, normalize=False)
+        if normalize:
+            peak = pattern.max()
+            pattern = pattern / peak if peak > 0 else pattern
+        return pattern
+
+    def beamwidth_estimate(self):
+        """Rough half-power beamwidth (degrees) of the narrower principal plane, λ / (N d)"""
+        aperture = max(self.nx * self.dx, self.ny * self.dy)
+        return float(np.degrees(self.wavelength / aperture))
+
+    def _sampling(self, n_cut=None, n_theta=None, n_phi=None):
+        """Cut and hemisphere sample counts; None scales them with the beamwidth
+
+        Small arrays keep at least the historical 721-point cut and 91 x 181
+        grid; large arrays get CUT_SAMPLES_PER_BEAM / GRID_SAMPLES_PER_BEAM
+        samples across the expected beamwidth.
+        """
+        step = self.beamwidth_estimate()
+        if n_cut is None:
+            n_cut = max(721, int(np.ceil(180 * CUT_SAMPLES_PER_BEAM / step)) + 1)
+        if n_theta is None:
+            n_theta = max(91, int(np.ceil(90 * GRID_SAMPLES_PER_BEAM / step)) + 1)
+        if n_phi is None:
+            n_phi = max(181, int(np.ceil(360 * GRID_SAMPLES_PER_BEAM / step)) + 1)
+        return n_cut, n_theta, n_phi
+
+    def _directivity(self, wx, wy, n_theta, n_phi):
+        """Directivity (linear) for (S, n) weights on an n_theta x n_phi hemisphere grid
+
+        The grid is evaluated a block of theta rows at a time: each block is
+        integrated over phi straight away, so memory stays bounded for fine
+        grids and large arrays.
+        """
+        theta, phi = np.linspace(0, 90, n_theta), np.linspace(0, 360, n_phi)
+        theta_r, phi_r = np.radians(theta), np.radians(phi)
+        rows = max(1, GRID_BLOCK // n_phi)
+
+        peak = np.zeros(wx.shape[0])
+        row_power = np.empty((wx.shape[0], n_theta))
+        for start in range(0, n_theta, rows):
+            grid_theta, grid_phi = np.meshgrid(theta[start:start + rows], phi, indexing='ij')
+            u, v = self._direction_cosines(grid_theta.ravel(), grid_phi.ravel())
+            element = self.element_pattern(grid_theta, grid_phi).ravel()
+            power = (np.abs(self._array_factor(self._axis_phases(u, v), wx, wy)) * element) ** 2
+            power = power.reshape(wx.shape[0], -1, n_phi)
+            peak = np.maximum(peak, power.max(axis=(1, 2)))
+            row_power[:, start:start + rows] = _trapezoid(power, phi_r, axis=2)
+
+        radiated = _trapezoid(row_power * np.sin(theta_r)[None, :], theta_r, axis=1)
+        return 4 * np.pi * peak / radiated
+
+    def directivity(self, n_theta=None, n_phi=None):
+        """Directivity in dBi at the current scan angle"""
+        return float(self.scan_sweep([self.theta0], self.phi0, n_theta=n_theta,
+                                     n_phi=n_phi)['directivity_dBi'][0])
+
+    def grating_lobes(self, theta0=None, phi0=None, orders=3):
+        """Check for grating lobes entering visible space
+
+        Grating lobes sit at (u0 + p*λ/dx, v0 + q*λ/dy) for integers (p, q) != 0;
+        any of them inside the unit circle is visible. Works on arrays of scan
+        angles and returns a boolean per scan angle plus the lobe directions.
+        """
+        theta0 = np.atleast_1d(self.theta0 if theta0 is None else theta0).astype(float)
+        phi0 = np.broadcast_to(np.atleast_1d(self.phi0 if phi0 is None else phi0),
+                               theta0.shape).astype(float)
+        u0, v0 = self._direction_cosines(theta0, phi0)
+
+        p, q = np.meshgrid(np.arange(-orders, orders + 1), np.arange(-orders, orders + 1),
+                           indexing='ij')
+        nonzero = (p != 0) | (q != 0)
+        p, q = p[nonzero], q[nonzero]
+
+        u = u0[:, None] + p[None, :] * self.wavelength / self.dx
+        v = v0[:, None] + q[None, :] * self.wavelength / self.dy
+        visible = (u ** 2 + v ** 2) <= 1
+
+        # Grating lobe directions in degrees, NaN where not visible
+        r = np.sqrt(np.where(visible, u ** 2 + v ** 2, np.nan))
+        lobe_theta = np.degrees(np.arcsin(r))
+        lobe_phi = np.degrees(np.arctan2(v, u)) % 360
+        lobe_phi = np.where(visible, lobe_phi, np.nan)
+
+        # Largest scan angle free of grating lobes for each axis
+        max_scan_x = np.degrees(np.arcsin(np.clip(self.wavelength / self.dx - 1, 0, 1)))
+        max_scan_y = np.degrees(np.arcsin(np.clip(self.wavelength / self.dy - 1, 0, 1)))
+
+        return {
+            'has_grating_lobes': visible.any(axis=1),
+            'lobe_theta': lobe_theta,
+            'lobe_phi': lobe_phi,
+            'max_scan_x': float(max_scan_x),
+            'max_scan_y': float(max_scan_y)
+        }
+
+    @staticmethod
+    def main_lobe_metrics(patterns, angles):
+        """Peak, half-power beamwidth and sidelobe level for rows of cut patterns
+
+        Vectorized counterpart of AntennaCalculator._calculate_beamwidth:
+        patterns is (S, T) linear magnitude, angles is (T,). The main lobe spans
+        the half-power points either side of the peak; the sidelobe level is the
+        largest value outside the first nulls bounding it.
+        """
+        patterns = np.atleast_2d(patterns)
+        S, T = patterns.shape
+        idx = np.arange(T)[None, :]
+
+        peak_idx = np.argmax(patterns, axis=1)
+        peak = patterns[np.arange(S), peak_idx]
+        rel = patterns / np.where(peak > 0, peak, 1)[:, None]
+        before, after = idx < peak_idx[:, None], idx > peak_idx[:, None]
+
+        # Half-power points, interpolated linearly between the samples around each crossing
+        below = rel <= HALF_POWER
+        left = np.max(np.where(below & before, idx, -1), axis=1)
+        right = np.min(np.where(below & after, idx, T), axis=1)
+        found = (left >= 0) & (right < T)
+
+        def crossing(outer, inner):
+            rows = np.arange(S)
+            outer, inner = np.clip(outer, 0, T - 1), np.clip(inner, 0, T - 1)
+            r0, r1 = rel[rows, outer], rel[rows, inner]
+            with np.errstate(all='ignore'):
+                fraction = np.where(r1 != r0, (HALF_POWER - r0) / (r1 - r0), 0.0)
+            return angles[outer] + fraction * (angles[inner] - angles[outer])
+
+        beamwidth = np.where(found, np.abs(crossing(right, right - 1) - crossing(left, left + 1)),
+                             np.nan)
+
+        # First nulls: where the pattern stops falling away from the peak
+        rising_left = np.zeros_like(below)
+        rising_left[:, 1:] = rel[:, :-1] > rel[:, 1:]
+        rising_right = np.zeros_like(below)
+        rising_right[:, :-1] = rel[:, 1:] > rel[:, :-1]
+        null_left = np.max(np.where(rising_left & before & (idx <= left[:, None]), idx, 0), axis=1)
+        null_right = np.min(np.where(rising_right & after & (idx >= right[:, None]), idx, T - 1),
+                            axis=1)
+
+        sidelobes = np.where((idx < null_left[:, None]) | (idx > null_right[:, None]), rel, 0.0)
+        peak_sidelobe = sidelobes.max(axis=1)
+        with np.errstate(divide='ignore'):
+            sll_db = np.where(peak_sidelobe > 0, 20 * np.log10(peak_sidelobe), -np.inf)
+
+        return {
+            'peak_angle': angles[peak_idx],
+            'beamwidth': beamwidth,
+            'sll_dB': sll_db
+        }
+
+    def scan_sweep(self, theta0_values, phi0=0.0, n_cut=None, n_theta=None, n_phi=None,
+                   efficiency=1.0, chunk_size=16):
+        """Patterns and figures of merit for a sweep of scan angles
+
+        For every scan angle this evaluates the total pattern on the scan-plane
+        cut (theta from -90 to 90 degrees) and on a hemisphere grid for the
+        directivity. All scan angles are computed together through matrix
+        products, in chunks to bound memory for large arrays and fine grids.
+        Sample counts left as None follow the array's beamwidth (_sampling).
+        """
+        theta0_values = np.atleast_1d(np.asarray(theta0_values, dtype=float))
+        S = theta0_values.size
+        n_cut, n_theta, n_phi = self._sampling(n_cut, n_theta, n_phi)
+
+        # Cut in the scan plane: negative theta maps to phi0 + 180
+        cut = np.linspace(-90, 90, n_cut)
+        cut_u, cut_v = self._direction_cosines(cut, phi0)
+        cut_phases = self._axis_phases(cut_u, cut_v)
+        cut_element = self.element_pattern(cut, phi0)
+
+        cut_patterns = np.empty((S, n_cut))
+        directivity = np.empty(S)
+        for start in range(0, S, chunk_size):
+            sl = slice(start, start + chunk_size)
+            wx, wy = self._steering_weights(theta0_values[sl], phi0)
+
+            cut_patterns[sl] = np.abs(self._array_factor(cut_phases, wx, wy)) * cut_element
+            directivity[sl] = self._directivity(wx, wy, n_theta, n_phi)
+
+        peak = cut_patterns.max(axis=1, keepdims=True)
+        cut_patterns = cut_patterns / np.where(peak > 0, peak, 1)
+        metrics = self.main_lobe_metrics(cut_patterns, cut)
+        grating = self.grating_lobes(theta0_values, phi0)
+
+        directivity_dbi = 10 * np.log10(directivity)
+        return {
+            'theta0': theta0_values,
+            'angles': cut,
+            'patterns': cut_patterns,
+            'peak_angle': metrics['peak_angle'],
+            'beamwidth': metrics['beamwidth'],
+            'sll_dB': metrics['sll_dB'],
+            'directivity_dBi': directivity_dbi,
+            'gain_dBi': directivity_dbi + 10 * np.log10(efficiency),
+            'has_grating_lobes': grating['has_grating_lobes']
+        }
+
+    def calculate_metrics(self, n_cut=None, n_theta=None, n_phi=None, efficiency=1.0):
+        """Summary of array performance at the current scan angle"""
+        sweep = self.scan_sweep([self.theta0], self.phi0, n_cut=n_cut, n_theta=n_theta,
+                                n_phi=n_phi, efficiency=efficiency)
+        grating = self.grating_lobes()
+
+        return {
+            'nx': self.nx,
+            'ny': self.ny,
+            'dx': self.dx,
+            'dy': self.dy,
+            'theta0': self.theta0,
+            'phi0': self.phi0,
+            'directivity_dBi': float(sweep['directivity_dBi'][0]),
+            'gain_dBi': float(sweep['gain_dBi'][0]),
+            'sll_dB': float(sweep['sll_dB'][0]),
+            'beamwidth': float(sweep['beamwidth'][0]),
+            'peak_angle': float(sweep['peak_angle'][0]),
+            'has_grating_lobes': bool(grating['has_grating_lobes'][0]),
+            'max_scan_x': grating['max_scan_x'],
+            'max_scan_y': grating['max_scan_y']
+        }
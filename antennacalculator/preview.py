@@ -0,0 +1,127 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from .kernels import get_kernel
+from .theme import FONT_SIZES, PLOT_COLORS
+
+# Layers drawn for every structure, bottom to top: (PLOT_COLORS key, legend label)
+LAYERS = (
+    ('ground_plane', 'Ground Plane'),
+    ('fringing_field', 'Fringing Field'),
+    ('patch', 'Patch')
+)
+
+# Renderer owned by each pool worker process
+_worker_renderer = None
+
+
+class PreviewRenderer:
+    """Headless structure preview renderer (Agg, no Qt)
+
+    Draws the same layers and styling as StructurePlot. The figure, axes
+    and polygons are created once; each render only replaces the polygon
+    vertices, limits and title before saving, so thousands of previews cost
+    little more than the rasterization itself.
+    """
+
+    def __init__(self, figsize=(4, 4), dpi=100):
+        self.figure = Figure(figsize=figsize, dpi=dpi, facecolor='white')
+        self.canvas = FigureCanvasAgg(self.figure)
+        self.ax = self.figure.add_subplot(111)
+
+        self.polygons = []
+        for key, label in LAYERS:
+            style = PLOT_COLORS[key]
+            polygon, = self.ax.fill([0, 1, 1], [0, 0, 1],
+                                    color=style['fill'],
+                                    alpha=style['alpha'],
+                                    label=label,
+                                    linewidth=style['linewidth'],
+                                    edgecolor=style['edge'])
+            self.polygons.append(polygon)
+
+        self.title = self.ax.set_title('', fontsize=FONT_SIZES['tiny'], fontweight='bold')
+        self.ax.set_xlabel('X (mm)', fontsize=FONT_SIZES['tiny'], fontweight='bold')
+        self.ax.set_ylabel('Y (mm)', fontsize=FONT_SIZES['tiny'], fontweight='bold')
+        self.ax.grid(True, linestyle='--', alpha=0.3, color='gray')
+        self.ax.legend(loc='upper right', framealpha=0.9, fontsize=FONT_SIZES['tiny'])
+        self.ax.set_aspect('equal')
+        self.figure.tight_layout()
+
+    def update(self, results):
+        """Move the polygons to the structure of results
+
+        Returns False, leaving the figure unchanged, for types without an
+        outline and for invalid (non-finite) designs.
+        """
+        outline = get_kernel(results['antenna_type']).geometry(results)
+        if outline is None or not np.all(np.isfinite([results['Wg'], results['Lg']])):
+            return False
+
+        for polygon, coords in zip(self.polygons, outline):
+            polygon.set_xy(np.column_stack([coords['x'], coords['y']]))
+        self.ax.set_xlim(-5, results['Wg'] + 10)
+        self.ax.set_ylim(-5, results['Lg'] + 5)
+        self.title.set_text(f"{results['f']:.4g} GHz, εr = {results['e']:.4g}, "
+                            f"h = {results['h']:.4g} mm")
+        return True
+
+    def render(self, results, path):
+        """Write the preview of one design; format follows the extension (.png, .svg, ...)"""
+        if not self.update(results):
+            return False
+        self.figure.savefig(path)
+        return True
+
+
+def _row(batch, i):
+    """Scalar result dict of row i of a batch"""
+    return {key: value[i] if isinstance(value, np.ndarray) else value for key, value in batch.items()}
+
+
+def _init_worker(figsize=(4, 4), dpi=100, enabled=True):
+    """Pool initializer: give this process its own renderer (None unless enabled)"""
+    global _worker_renderer
+    _worker_renderer = PreviewRenderer(figsize, dpi) if enabled else None
+
+
+def _renderer():
+    """Renderer of this process, as set up by _init_worker"""
+    return _worker_renderer
+
+
+def _render_chunk(task):
+    paths, rows = task
+    return [path if _worker_renderer.render(row, path) else None for path, row in zip(paths, rows)]
+
+
+def render_previews(batch, directory, fmt='png', workers=None, chunk_size=64, figsize=(4, 4),
+                    dpi=100, name_format='design_{:06d}'):
+    """Render one preview per row of batch results and return their paths
+
+    batch is the output of calculate_batch or calculate_mixed_batch (1-D).
+    Rows are sent to workers in chunks; each worker process renders with
+    its own PreviewRenderer. Rows that cannot be drawn get None.
+    """
+    os.makedirs(directory, exist_ok=True)
+    n = np.shape(batch['W'])[0]
+    paths = [os.path.join(directory, f"{name_format.format(i)}.{fmt}") for i in range(n)]
+    tasks = ((paths[start:start + chunk_size],
+              [_row(batch, i) for i in range(start, min(start + chunk_size, n))])
+             for start in range(0, n, chunk_size))
+
+    rendered = []
+    if workers is None or workers <= 1:
+        _init_worker(figsize, dpi)
+        for task in tasks:
+            rendered.extend(_render_chunk(task))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(figsize, dpi)) as pool:
+            for chunk in pool.map(_render_chunk, tasks):
+                rendered.extend(chunk)
+    return rendered
@@ -0,0 +1,247 @@
+import base64
+import html
+import io
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .kernels import get_kernel
+from .preview import PreviewRenderer, _init_worker, _renderer, _row
+from .validation import describe_errors
+
+# Output format by file extension
+FORMATS = {
+    '.html': 'html',
+    '.htm': 'html',
+    '.md': 'markdown',
+    '.markdown': 'markdown',
+    '.pdf': 'pdf'
+}
+
+# Summary table columns: (result key, heading, format spec)
+SUMMARY_COLUMNS = (
+    ('f', 'f (GHz)', '.3f'),
+    ('e', 'εr', '.2f'),
+    ('h', 'h (mm)', '.3f'),
+    ('W', 'W (mm)', '.2f'),
+    ('L', 'L (mm)', '.2f'),
+    ('Wg', 'Wg (mm)', '.2f'),
+    ('Lg', 'Lg (mm)', '.2f'),
+    ('S11', 'S11 (dB)', '.2f')
+)
+
+HTML_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; }}
+table {{ border-collapse: collapse; }}
+th, td {{ border: 1px solid #ccc; padding: 2px 8px; text-align: right; }}
+section {{ display: flex; gap: 2em; align-items: flex-start; border-top: 1px solid #ccc; }}
+pre {{ font-size: 12px; }}
+</style>
+</head>
+<body>
+<h1>{title}</h1>
+"""
+
+
+def format_column(values, spec, missing='—'):
+    """Format one column of numbers at once; NaN (and absent) values become missing"""
+    values = np.asarray(values, dtype=float)
+    return np.where(np.isfinite(values), np.char.mod(f'%{spec}', values), missing).tolist()
+
+
+def _take(batch, rows):
+    """Rows of 1-D batch results (scalars such as a single antenna type are kept)"""
+    return {key: value[rows] if isinstance(value, np.ndarray) else value
+            for key, value in batch.items()}
+
+
+def _types(batch, n):
+    return np.broadcast_to(np.asarray(batch['antenna_type'], dtype=object), (n,))
+
+
+def summary_table(batch, start=0):
+    """Heading and row cells of the summary table, formatted column by column"""
+    n = len(np.atleast_1d(batch['f']))
+    headings = ['#', 'Type'] + [heading for _, heading, _ in SUMMARY_COLUMNS]
+    columns = [[str(start + i + 1) for i in range(n)], list(_types(batch, n))]
+    for key, _, spec in SUMMARY_COLUMNS:
+        columns.append(format_column(np.broadcast_to(batch.get(key, np.nan), (n,)), spec))
+    if 'error_code' in batch:
+        headings.append('Status')
+        columns.append(['OK' if code == 0 else '; '.join(describe_errors(code))
+                        for code in np.atleast_1d(batch['error_code']).tolist()])
+    return headings, [list(row) for row in zip(*columns)]
+
+
+def _report_texts(batch, n):
+    """Parameter and summary texts of every row, rendered per antenna type group"""
+    types = _types(batch, n)
+    params, summaries = [None] * n, [None] * n
+    for name in dict.fromkeys(types):
+        rows = np.flatnonzero(types == name)
+        group_params, group_summaries = get_kernel(name).report_columns(_take(batch, rows))
+        for row, p, s in zip(rows, group_params, group_summaries):
+            params[row], summaries[row] = p, s
+    return params, summaries
+
+
+def _preview(batch, i, fmt, preview_path):
+    """Preview of row i: base64 PNG (html), written file (markdown) or None"""
+    renderer = _renderer()
+    if not renderer.update(_row(batch, i)):
+        return None
+    if fmt == 'html':
+        buffer = io.BytesIO()
+        renderer.figure.savefig(buffer, format='png')
+        return base64.b64encode(buffer.getvalue()).decode('ascii')
+    renderer.figure.savefig(preview_path)
+    return preview_path
+
+
+def _render_chunk(task):
+    """Report sections of one chunk of designs (pool worker)"""
+    fmt, start, batch, preview_dir = task
+    n = len(np.atleast_1d(batch['f']))
+    types = _types(batch, n)
+    params, summaries = _report_texts(batch, n)
+
+    sections = []
+    for i in range(n):
+        number = start + i + 1
+        if fmt == 'pdf':
+            sections.append(params[i] + '\n' + summaries[i])
+            continue
+
+        image = None
+        if _renderer() is not None:
+            path = os.path.join(preview_dir, f"design_{number:06d}.png") if preview_dir else None
+            image = _preview(batch, i, fmt, path)
+
+        if fmt == 'html':
+            figure = (f'<img src="data:image/png;base64,{image}" alt="Design {number}">'
+                      if image else '')
+            sections.append(f'<section id="design-{number}">\n<div><h2>Design {number}: '
+                            f'{html.escape(types[i])}</h2>\n<pre>{html.escape(params[i])}</pre>\n'
+                            f'<pre>{html.escape(summaries[i])}</pre></div>\n{figure}\n</section>\n')
+        else:
+            figure = (f"![Design {number}]({os.path.basename(preview_dir)}/"
+                      f"{os.path.basename(image)})\n\n" if image else '')
+            sections.append(f"## Design {number}: {types[i]}\n\n{figure}```text\n{params[i]}\n"
+                            f"{summaries[i]}\n```\n\n")
+    return sections
+
+
+def _ordered_results(pool, tasks, window):
+    """pool results of tasks in order, with at most window tasks in flight"""
+    pending = deque()
+    for task in tasks:
+        pending.append(pool.submit(_render_chunk, task))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _write_pdf(path, batch, chunks, previews):
+    """Summary pages, then one page per design with its preview above the report"""
+    from matplotlib.backends.backend_pdf import PdfPages
+
+    # The bundled DejaVu fonts lack the report's emoji; the rest of the text renders
+    def printable(text):
+        return ''.join(ch for ch in text if ord(ch) <= 0xFFFF)
+
+    renderer = PreviewRenderer(figsize=(8.27, 11.69))
+    renderer.ax.set_position([0.12, 0.55, 0.76, 0.4])
+    text = renderer.figure.text(0.06, 0.5, '', family='monospace', fontsize=7, va='top')
+
+    headings, rows = summary_table(batch)
+    widths = [max(len(cell) for cell in column) for column in zip(headings, *rows)]
+    lines = ['  '.join(cell.rjust(width) for cell, width in zip(line, widths))
+             for line in [headings] + rows]
+
+    with PdfPages(path) as pdf:
+        renderer.ax.set_visible(False)
+        for page in range(0, len(lines) - 1, 80):
+            text.set_position((0.06, 0.95))
+            text.set_text(printable('\n'.join([lines[0]] + lines[1 + page:81 + page])))
+            pdf.savefig(renderer.figure)
+
+        text.set_position((0.06, 0.5))
+        number = 0
+        for sections in chunks:
+            for section in sections:
+                renderer.ax.set_visible(previews and renderer.update(_row(batch, number)))
+                text.set_text(printable(section))
+                pdf.savefig(renderer.figure)
+                number += 1
+
+
+def export_reports(batch, path, fmt=None, workers=None, chunk_size=100, previews=True,
+                   title='Patch Antenna Design Report'):
+    """Write a report of every design in batch results to path
+
+    batch is 1-D output of calculate_batch or calculate_mixed_batch
+    (validate=True adds a status column). fmt is 'html', 'markdown' or
+    'pdf', by default from the extension. The summary table comes first,
+    then one section per design with its structure preview (inline PNG
+    for HTML, PNG files in '<name>_previews' for Markdown). Chunks of
+    designs are rendered by worker processes when workers > 1 and written
+    to the file in order as they complete, keeping only a few chunks in
+    memory. PDF pages are drawn in this process.
+    """
+    fmt = fmt or FORMATS.get(os.path.splitext(path)[1].lower())
+    if fmt not in FORMATS.values():
+        raise ValueError(f"Unknown report format for '{path}'. Available: {', '.join(FORMATS)}")
+
+    n = len(np.atleast_1d(batch['f']))
+    batch = {key: np.broadcast_to(value, (n,)) if isinstance(value, np.ndarray) and value.ndim < 2
+             else value for key, value in batch.items()}
+    preview_dir = None
+    if fmt == 'markdown' and previews:
+        preview_dir = os.path.splitext(path)[0] + '_previews'
+        os.makedirs(preview_dir, exist_ok=True)
+
+    tasks = ((fmt, start, _take(batch, slice(start, start + chunk_size)), preview_dir)
+             for start in range(0, n, chunk_size))
+    worker_previews = previews and fmt != 'pdf'
+
+    def write(chunks):
+        if fmt == 'pdf':
+            _write_pdf(path, batch, chunks, previews)
+            return
+
+        headings, rows = summary_table(batch)
+        with open(path, 'w', encoding='utf-8', buffering=1 << 20) as handle:
+            if fmt == 'html':
+                handle.write(HTML_HEAD.format(title=html.escape(title)))
+                handle.write('<table>\n<tr>' + ''.join(f'<th>{html.escape(h)}</th>' for h in headings) +
+                             '</tr>\n')
+                handle.writelines('<tr>' + ''.join(f'<td>{html.escape(c)}</td>' for c in row) +
+                                  '</tr>\n' for row in rows)
+                handle.write('</table>\n')
+            else:
+                handle.write(f"# {title}\n\n| " + ' | '.join(headings) + ' |\n|' +
+                             '---|' * len(headings) + '\n')
+                handle.writelines('| ' + ' | '.join(row) + ' |\n' for row in rows)
+                handle.write('\n')
+
+            for sections in chunks:
+                handle.writelines(sections)
+            if fmt == 'html':
+                handle.write('</body>\n</html>\n')
+
+    if workers is None or workers <= 1:
+        _init_worker(enabled=worker_previews)
+        write(_render_chunk(task) for task in tasks)
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=((4, 4), 100, worker_previews)) as pool:
+            write(_ordered_results(pool, tasks, 2 * workers))
+    return path
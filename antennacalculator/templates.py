@@ -0,0 +1,57 @@
+from string import Formatter
+
+import numpy as np
+
+
+class ReportTemplate:
+    """Text template compiled once from str.format syntax
+
+    Fields name result keys ('{W:.4f}'); missing keys render as 0, like the
+    original report f-strings. Computed fields are passed as derived, a
+    dict of name -> function of the results that also works on arrays.
+    The source is parsed once into literal and field parts, so rendering
+    skips the format-string parser, and render_columns formats each field
+    for a whole batch at once before the rows are joined.
+    """
+
+    def __init__(self, source, derived=None):
+        self.source = source
+        self.derived = derived or {}
+        self.literals, self.fields = [], []
+        for literal, name, spec, conversion in Formatter().parse(source):
+            self.literals.append(literal)
+            if name is not None:
+                self.fields.append((name, spec))
+        # One literal more than fields: the text after the last field
+        if len(self.literals) == len(self.fields):
+            self.literals.append('')
+
+    def _value(self, results, name):
+        value = self.derived[name](results) if name in self.derived else results.get(name, 0)
+        return value.item() if isinstance(value, np.ndarray) and value.ndim == 0 else value
+
+    def render(self, results):
+        """Report text of one result dict"""
+        parts = [self.literals[0]]
+        for (name, spec), literal in zip(self.fields, self.literals[1:]):
+            parts.append(format(self._value(results, name), spec))
+            parts.append(literal)
+        return ''.join(parts)
+
+    def render_columns(self, batch, n=None):
+        """Report texts of every row of batch results (1-D arrays), formatted column by column"""
+        if n is None:
+            n = len(np.atleast_1d(batch['f']))
+        columns = []
+        for name, spec in self.fields:
+            values = np.broadcast_to(np.asarray(self._value(batch, name)), (n,)).tolist()
+            columns.append([format(value, spec) for value in values])
+
+        rows = []
+        for cells in zip(*columns) if columns else [()] * n:
+            parts = [self.literals[0]]
+            for cell, literal in zip(cells, self.literals[1:]):
+                parts.append(cell)
+                parts.append(literal)
+            rows.append(''.join(parts))
+        return rows
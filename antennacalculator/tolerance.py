@@ -0,0 +1,173 @@
+import numpy as np
+
+from .backend import AntennaCalculator
+from .kernels import get_kernel
+
+# Default manufacturing tolerances (one standard deviation)
+DEFAULT_TOLERANCES = {
+    'e': 0.02,      # relative, dielectric constant
+    'h': 0.05,      # relative, substrate height
+    't': 0.10,      # relative, copper thickness
+    'etch': 0.025   # absolute mm, added to both patch edges' width and length
+}
+
+# Two-sided 95% normal quantile for the yield confidence interval
+Z_95 = 1.959963984540054
+
+
+class StreamingHistogram:
+    """Fixed-bin histograms for many designs, updated chunk by chunk
+
+    Counts are kept per design in a (D, bins + 2) array; the two extra columns
+    catch samples below and above the range so quantiles stay honest.
+    """
+
+    def __init__(self, low, high, bins, n_designs):
+        self.edges = np.linspace(low, high, bins + 1)
+        self.counts = np.zeros((n_designs, bins + 2), dtype=np.int64)
+
+    def update(self, values):
+        """Add a (D, n) chunk of samples; non-finite values are ignored"""
+        D, bins = self.counts.shape
+        finite = np.isfinite(values)
+        slot = np.searchsorted(self.edges, np.where(finite, values, 0), side='right')
+        flat = (np.arange(D)[:, None] * bins + slot)[finite]
+        self.counts += np.bincount(flat, minlength=D * bins).reshape(D, bins)
+
+    def quantiles(self, q):
+        """Approximate quantiles per design, linear within a bin (NaN for empty designs)"""
+        q = np.atleast_1d(q)
+        cdf = np.cumsum(self.counts, axis=1)[:, :-1]
+        total = self.counts.sum(axis=1, keepdims=True)
+        target = q[None, :] * total
+
+        out = np.empty((self.counts.shape[0], q.size))
+        for d in range(self.counts.shape[0]):
+            # Cumulative counts at each bin edge, including the underflow bin
+            out[d] = np.interp(target[d], cdf[d], self.edges)
+        out[total[:, 0] == 0] = np.nan
+        return out
+
+    @property
+    def histogram(self):
+        """In-range counts per design, (D, bins)"""
+        return self.counts[:, 1:-1]
+
+
+class ToleranceAnalysis:
+    """Monte Carlo yield of fabricated patches against an S11 specification"""
+
+    def __init__(self, tolerances=None, antenna_type="Microstrip Patch Antenna (Inset-Fed)",
+                 calculator=None):
+        if not get_kernel(antenna_type).rectangular:
+            raise ValueError(f"Tolerance analysis covers rectangular patches only, not '{antenna_type}'")
+        self.tolerances = dict(DEFAULT_TOLERANCES, **(tolerances or {}))
+        self.antenna_type = antenna_type
+        self.calculator = calculator or AntennaCalculator()
+
+    def _draw(self, rng, nominal, n):
+        """Perturbed (e, h, t, etch) samples of shape (D, n)"""
+        tol = self.tolerances
+        D = nominal['e'].shape[0]
+        e = nominal['e'][:, None] * (1 + tol['e'] * rng.standard_normal((D, n)))
+        h = nominal['h'][:, None] * (1 + tol['h'] * rng.standard_normal((D, n)))
+        t = nominal['t'][:, None] * (1 + tol['t'] * rng.standard_normal((D, n)))
+        etch = tol['etch'] * rng.standard_normal((D, n))
+        return e, h, t, etch
+
+    def _evaluate(self, nominal, e, h, t, etch):
+        """Resonant frequency (GHz) and S11 at the design frequency of fabricated boards
+
+        The patch is etched to the nominal W and L plus the etch error; copper
+        thickness widens it electrically (Wheeler's correction). Away from
+        resonance the input impedance follows a parallel RLC with the
+        backend's radiation Q, so a detuned board loses its match.
+        """
+        calc = self.calculator
+        with np.errstate(all='ignore'):
+            W = nominal['W'][:, None] + etch
+            L = nominal['L'][:, None] + etch
+            # No widening for zero-thickness copper (the correction's limit as t -> 0)
+            W_eff = W + np.where(t > 0, (t / np.pi) * (1 + np.log(2 * h / t)), 0.0)
+
+            f_res = calc.calculate_resonant_frequency(e, h, W_eff, L)
+
+            Zo = nominal['Zo'][:, None]
+            Rin = W ** 2 / (1.5 * e)
+            Zin = Zo / (1 + (Zo / Rin))
+            ereff = calc._effective_permittivity(e, h, W_eff)
+            Q = calc.radiation_q(ereff, h, f_res)
+
+            Z = calc.parallel_rlc_impedance(Zin, Q, nominal['f'][:, None], f_res)
+            S11 = 20 * np.log10(np.abs((Z - Zo) / (Z + Zo)))
+
+        return f_res, S11
+
+    def run(self, f, e, t, h, Zo, n_samples=1_000_000, spec=-10.0, seed=0,
+            chunk_size=250_000, quantiles=(0.01, 0.05, 0.5, 0.95, 0.99), bins=2000,
+            f_span=0.2):
+        """Estimate yield and resonant-frequency spread for one or more designs
+
+        Nominal inputs broadcast to D designs. Each design gets n_samples
+        perturbed boards, evaluated in chunks of chunk_size boards spread over
+        all designs, so memory stays bounded. Chunk k draws from a generator
+        seeded with (seed, k): a run is reproducible for a given seed and
+        chunk_size. Only counts, running moments and fixed-bin histograms are
+        kept; quantiles come from the histograms (f_res bins span
+        ±f_span around the design frequency).
+        """
+        nominal = self.calculator.calculate_batch(f, e, t, h, Zo, self.antenna_type)
+        nominal = {key: np.atleast_1d(nominal[key]).ravel()
+                   for key in ('f', 'e', 't', 'h', 'Zo', 'W', 'L')}
+        D = nominal['f'].shape[0]
+        per_chunk = max(1, chunk_size // D)
+
+        f0 = nominal['f'][:, None]
+        f_hist = StreamingHistogram(-f_span, f_span, bins, D)
+        s11_hist = StreamingHistogram(-60.0, 0.0, bins, D)
+
+        passed = np.zeros(D, dtype=np.int64)
+        count, mean, m2 = np.zeros(D, dtype=np.int64), np.zeros(D), np.zeros(D)
+
+        for k, start in enumerate(range(0, n_samples, per_chunk)):
+            n = min(per_chunk, n_samples - start)
+            rng = np.random.default_rng([seed, k])
+            f_res, S11 = self._evaluate(nominal, *self._draw(rng, nominal, n))
+
+            passed += np.sum(S11 < spec, axis=1)
+            f_hist.update(f_res / f0 - 1)
+            s11_hist.update(S11)
+
+            # Merge chunk moments of f_res into the running ones (Chan et al.)
+            finite = np.isfinite(f_res)
+            n_chunk = finite.sum(axis=1)
+            chunk_mean = np.where(finite, f_res, 0).sum(axis=1) / np.maximum(n_chunk, 1)
+            chunk_m2 = np.where(finite, (f_res - chunk_mean[:, None]) ** 2, 0).sum(axis=1)
+            total = count + n_chunk
+            delta = chunk_mean - mean
+            mean = mean + delta * n_chunk / np.maximum(total, 1)
+            m2 = m2 + chunk_m2 + delta ** 2 * count * n_chunk / np.maximum(total, 1)
+            count = total
+
+        # Wilson score interval for the pass fraction
+        p = passed / n_samples
+        denom = 1 + Z_95 ** 2 / n_samples
+        centre = (p + Z_95 ** 2 / (2 * n_samples)) / denom
+        half = Z_95 * np.sqrt(p * (1 - p) / n_samples + Z_95 ** 2 / (4 * n_samples ** 2)) / denom
+
+        quantiles = np.asarray(quantiles, dtype=float)
+        return {
+            'n_samples': n_samples,
+            'spec': spec,
+            'yield': p,
+            'yield_ci': np.clip(np.column_stack([centre - half, centre + half]), 0, 1),
+            'f_res_mean': mean,
+            'f_res_std': np.sqrt(m2 / np.maximum(count - 1, 1)),
+            'quantile_levels': quantiles,
+            'f_res_quantiles': (1 + f_hist.quantiles(quantiles)) * f0,
+            'S11_quantiles': s11_hist.quantiles(quantiles),
+            'f_res_histogram': f_hist.histogram,
+            'f_res_edges': (1 + f_hist.edges[None, :]) * f0,
+            'S11_histogram': s11_hist.histogram,
+            'S11_edges': s11_hist.edges
+        }
@@ -0,0 +1,85 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .backend import AntennaCalculator
+
+# Write buffer per file; a few hundred points of S11 fit comfortably
+BUFFER_SIZE = 1 << 16
+
+
+def format_s1p(frequencies, s11, z0=50.0, comment=None):
+    """Touchstone 1.0 text of one S11 spectrum (frequencies in GHz, RI format)"""
+    lines = [f"! {line}" for line in (comment or '').splitlines()]
+    lines.append(f"# GHZ S RI R {z0:g}")
+    # One format operation for the whole table instead of one per row
+    table = np.column_stack([frequencies, s11.real, s11.imag])
+    data = ('%.9g %.9g %.9g\n' * table.shape[0]) % tuple(table.ravel().tolist())
+    return '\n'.join(lines) + '\n' + data
+
+
+def write_s1p(path, frequencies, s11, z0=50.0, comment=None):
+    """Write one S11 spectrum to a .s1p file with a single buffered write"""
+    with open(path, 'w', buffering=BUFFER_SIZE, encoding='ascii') as handle:
+        handle.write(format_s1p(frequencies, s11, z0, comment))
+
+
+def _export_chunk(task):
+    """Compute and write the spectra of one chunk of designs (pool worker)
+
+    Designs that fail validation are not written; their path is None.
+    """
+    directory, name_format, start, inputs, antenna_type, frequencies = task
+    calc = AntennaCalculator()
+    with np.errstate(all='ignore'):
+        results = calc.calculate_batch(*inputs, antenna_type, validate=True)
+        Z = calc.calculate_impedance_sweep(results, frequencies)
+        Zo = results['Zo'][:, None]
+        S11 = (Z - Zo) / (Z + Zo)
+
+    # Touchstone files are ASCII; escape anything else in a plugin's type name
+    name = antenna_type.encode('ascii', 'backslashreplace').decode('ascii')
+    paths = []
+    for i in range(S11.shape[0]):
+        if not results['status'][i]:
+            paths.append(None)
+            continue
+        path = os.path.join(directory, name_format.format(start + i))
+        comment = (f"{name}\n"
+                   f"f = {results['f'][i]:.6g} GHz, er = {results['e'][i]:.6g}, "
+                   f"h = {results['h'][i]:.6g} mm, t = {results['t'][i]:.6g} mm")
+        write_s1p(path, frequencies, S11[i], results['Zo'][i], comment)
+        paths.append(path)
+    return paths
+
+
+def export_s1p(directory, f, e, t, h, Zo, antenna_type, frequencies, chunk_size=500,
+               workers=None, name_format='design_{:06d}.s1p'):
+    """Write one .s1p file of swept S11 per design and return their paths
+
+    Inputs broadcast to a batch of designs like calculate_batch;
+    frequencies is the sweep in GHz. Designs are computed and written
+    chunk_size at a time, so only one chunk of spectra is in memory per
+    worker. workers > 1 spreads the chunks over a process pool; None or 1
+    writes from this process. Designs that fail validation are skipped
+    and get None in place of a path.
+    """
+    os.makedirs(directory, exist_ok=True)
+    frequencies = np.asarray(frequencies, dtype=float)
+    inputs = [a.ravel() for a in np.broadcast_arrays(*(np.asarray(v, dtype=float)
+                                                       for v in (f, e, t, h, Zo)))]
+
+    tasks = ((directory, name_format, start, [a[start:start + chunk_size] for a in inputs],
+              antenna_type, frequencies)
+             for start in range(0, inputs[0].size, chunk_size))
+
+    paths = []
+    if workers is None or workers <= 1:
+        for task in tasks:
+            paths.extend(_export_chunk(task))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for chunk_paths in pool.map(_export_chunk, tasks):
+                paths.extend(chunk_paths)
+    return paths
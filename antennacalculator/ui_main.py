@@ -1,18 +1,23 @@
 import sys
+from datetime import datetime
 import matplotlib
+import numpy as np
 matplotlib.use('QtAgg')
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QGridLayout, QGroupBox, QLabel, QPushButton,
     QComboBox, QCheckBox, QTextEdit, QDoubleSpinBox,
-    QFrame, QScrollArea, QTabWidget
+    QFrame, QScrollArea, QTabWidget, QTableView, QAbstractItemView, QHeaderView
 )
-from PyQt6.QtCore import pyqtSignal, pyqtSlot
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QThread, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QFont, QAction
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
 from .backend import AntennaCalculator
+from .design_search import DesignSearch, SUBSTRATES
+from .history import DesignHistory
+from .kernels import KERNELS, get_kernel, load_plugins
 from .theme import (
     FONT_SIZES, FONTS, GLOBAL_STYLESHEET, STATUS_BAR_STYLESHEET,
     get_button_stylesheet, get_spinbox_button_stylesheet, PLOT_COLORS
@@ -143,11 +148,7 @@ class InputPanel(QGroupBox):
         # Antenna Type
         scroll_layout.addWidget(QLabel("Antenna Type"), row, 0)
         self.antenna_type_combo = QComboBox()
-        self.antenna_type_combo.addItems([
-            "Microstrip Patch Antenna (Inset-Fed)",
-            "Coaxial Feed Patch Antenna (Beta)",
-            "Circularly Polarized Antennas (Beta)"
-        ])
+        self.antenna_type_combo.addItems(list(KERNELS))
         scroll_layout.addWidget(self.antenna_type_combo, row, 1, 1, 2)
         row += 1
 
@@ -182,6 +183,16 @@ class InputPanel(QGroupBox):
         params = self.get_values()
         self.calculate_requested.emit(params)
 
+    def set_values(self, results):
+        """Load the inputs of a stored design"""
+        self.freq_input.setValue(results['f'])
+        self.epsilon_input.setValue(results['e'])
+        self.thickness_input.setValue(results['t'])
+        self.height_input.setValue(results['h'])
+        self.impedance_input.setValue(results['Zo'])
+        self.auto_calc_check.setChecked(False)
+        self.antenna_type_combo.setCurrentText(results['antenna_type'])
+
     def get_values(self):
         return {
             'f': self.freq_input.value(),
@@ -193,11 +204,206 @@ class InputPanel(QGroupBox):
             'auto_calculate_h': self.auto_calc_check.isChecked()
         }
 
+class DesignSearchThread(QThread):
+    """Runs a Pareto design search off the GUI thread"""
+    progress = pyqtSignal(int, int)
+    search_complete = pyqtSignal(dict)
+    search_failed = pyqtSignal(str)
+
+    def __init__(self, params):
+        super().__init__()
+        self.params = params
+
+    def run(self):
+        try:
+            search = DesignSearch(self.params['f'], self.params['antenna_type'])
+            front = search.search(
+                list(SUBSTRATES.values()),
+                np.linspace(0.2, 3.2, 151),
+                t_values=[self.params['t']],
+                Zo_values=np.linspace(30.0, 120.0, 91),
+                progress=self.progress.emit
+            )
+            self.search_complete.emit(front)
+        except Exception as e:
+            self.search_failed.emit(str(e))
+
+class FeedMapThread(QThread):
+    """Computes a coax feed-position impedance map off the GUI thread"""
+    map_complete = pyqtSignal(int, dict)
+    map_failed = pyqtSignal(int, str)
+
+    def __init__(self, calculator, results, nx, ny, request):
+        super().__init__()
+        self.calculator = calculator
+        self.results = results
+        self.nx, self.ny = nx, ny
+        self.request = request
+
+    def run(self):
+        try:
+            feed_map = self.calculator.calculate_feed_map(self.results, self.nx, self.ny)
+            self.map_complete.emit(self.request, feed_map)
+        except Exception as e:
+            self.map_failed.emit(self.request, str(e))
+
+class ParetoPlot(QWidget):
+    """Scatter view of a design-search Pareto front"""
+
+    def __init__(self):
+        super().__init__()
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.figure = Figure(figsize=(5, 4), facecolor='white')
+        self.canvas = FigureCanvas(self.figure)
+        self.toolbar = NavigationToolbar(self.canvas, self)
+        layout.addWidget(self.toolbar)
+        layout.addWidget(self.canvas)
+        self.setLayout(layout)
+        self.clear_plot()
+
+    def plot_front(self, front):
+        """Ground area against bandwidth, coloured by S11 where available"""
+        self.figure.clear()
+        ax = self.figure.add_subplot(111)
+        names = front['objective_names']
+        ground_area = front['objectives'][:, names.index('ground_area')]
+        bandwidth = 100 * front['bandwidth']
+
+        if 'S11' in names:
+            points = ax.scatter(ground_area, bandwidth, c=front['objectives'][:, names.index('S11')],
+                                cmap='viridis_r', s=14, alpha=0.85)
+            colorbar = self.figure.colorbar(points, ax=ax)
+            colorbar.set_label('S11 (dB)', fontsize=FONT_SIZES['tiny'])
+        else:
+            ax.scatter(ground_area, bandwidth, color=PLOT_COLORS['patch']['edge'], s=14, alpha=0.85)
+
+        ax.set_title(f"Pareto Front ({len(ground_area)} of {front['evaluated']:,} designs)",
+                     fontsize=FONT_SIZES['medium'], fontweight='bold')
+        ax.set_xlabel('Ground Area Wg × Lg (mm²)', fontsize=FONT_SIZES['tiny'], fontweight='bold')
+        ax.set_ylabel('Bandwidth (%)', fontsize=FONT_SIZES['tiny'], fontweight='bold')
+        ax.grid(True, linestyle='--', alpha=0.3, color='gray')
+        self.figure.tight_layout()
+        self.canvas.draw()
+
+    def clear_plot(self):
+        self.figure.clear()
+        ax = self.figure.add_subplot(111)
+        ax.set_title('Pareto Front', fontsize=FONT_SIZES['medium'], fontweight='bold')
+        ax.grid(True, linestyle='--', alpha=0.3)
+        ax.text(0.5, 0.5, 'Run Tools → Design Search to view trade-offs',
+                ha='center', va='center', transform=ax.transAxes,
+                fontsize=FONT_SIZES['normal'], color='gray', style='italic')
+        self.canvas.draw()
+
+class HistoryModel(QAbstractTableModel):
+    """Table view of a DesignHistory, newest first, read on demand"""
+
+    COLUMNS = [
+        ('#', None), ('Time', None), ('Antenna Type', None),
+        ('f (GHz)', 'f'), ('εr', 'e'), ('h (mm)', 'h'),
+        ('W (mm)', 'W'), ('L (mm)', 'L'), ('S11 (dB)', 'S11')
+    ]
+
+    def __init__(self, history):
+        super().__init__()
+        self.history = history
+
+    def entry_index(self, row):
+        return len(self.history) - 1 - row
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.history)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.COLUMNS[section][0]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+
+        entry = self.entry_index(index.row())
+        column = index.column()
+        if column == 0:
+            return str(entry + 1)
+        if column == 1:
+            return datetime.fromtimestamp(self.history.timestamp(entry)).strftime('%Y-%m-%d %H:%M:%S')
+        if column == 2:
+            return self.history.antenna_type(entry)
+
+        value = self.history.value(entry, self.COLUMNS[column][1])
+        return '—' if value != value else f"{value:.4f}"
+
+    def entry_added(self):
+        """Call after the history grew by one entry
+
+        The calculator appends to the DesignHistory itself, so by the time
+        the model hears of it rowCount has already changed; a row insertion
+        would be announced too late. The views are reset instead.
+        """
+        self.beginResetModel()
+        self.endResetModel()
+
+class HistoryPanel(QWidget):
+    """Past designs with recall and side-by-side comparison"""
+    recall_requested = pyqtSignal(int)
+    compare_requested = pyqtSignal(list)
+
+    def __init__(self, history):
+        super().__init__()
+        self.model = HistoryModel(history)
+        self.setup_ui()
+
+    def setup_ui(self):
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.table.verticalHeader().setVisible(False)
+        self.table.doubleClicked.connect(lambda index: self.recall_requested.emit(
+            self.model.entry_index(index.row())))
+        layout.addWidget(self.table)
+
+        buttons = QHBoxLayout()
+        recall_button = ModernButton("↩ Recall Design", 'primary')
+        recall_button.clicked.connect(self.on_recall)
+        compare_button = ModernButton("⚖️ Compare Selected", 'accent')
+        compare_button.clicked.connect(self.on_compare)
+        buttons.addWidget(recall_button)
+        buttons.addWidget(compare_button)
+        layout.addLayout(buttons)
+
+        self.setLayout(layout)
+
+    def selected_entries(self):
+        rows = sorted(index.row() for index in self.table.selectionModel().selectedRows())
+        return [self.model.entry_index(row) for row in rows]
+
+    def on_recall(self):
+        entries = self.selected_entries()
+        if entries:
+            self.recall_requested.emit(entries[0])
+
+    def on_compare(self):
+        entries = self.selected_entries()
+        if len(entries) >= 2:
+            self.compare_requested.emit(entries)
+
 class OutputPanel(QGroupBox):
     """Enhanced output display panel with tabs"""
 
-    def __init__(self):
+    def __init__(self, history=None):
         super().__init__("📊 Results")
+        self.history = history
         self.setup_ui()
 
     def setup_ui(self):
@@ -217,91 +423,46 @@ class OutputPanel(QGroupBox):
         self.summary_text.setFont(QFont(FONTS['monospace'].split(',')[0], FONT_SIZES['small']))
         self.tabs.addTab(self.summary_text, "📝 Summary")
 
+        # Pareto front tab
+        self.pareto_plot = ParetoPlot()
+        self.tabs.addTab(self.pareto_plot, "📈 Pareto Front")
+
+        # History and comparison tabs
+        if self.history is not None:
+            self.history_panel = HistoryPanel(self.history)
+            self.tabs.addTab(self.history_panel, "🕘 History")
+
+            self.compare_text = QTextEdit()
+            self.compare_text.setReadOnly(True)
+            self.compare_text.setFont(QFont(FONTS['monospace'].split(',')[0], FONT_SIZES['small']))
+            self.compare_text.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
+            self.tabs.addTab(self.compare_text, "⚖️ Compare")
+
         layout.addWidget(self.tabs)
         self.setLayout(layout)
 
     def update_output(self, results, antenna_type):
         """Update the output display with calculation results"""
-        # Detailed parameters
-        if antenna_type == "Microstrip Patch Antenna (Inset-Fed)":
-            params_text = f"""╔══════════════════════════════════════════════════════╗
-║           MICROSTRIP PATCH ANTENNA DESIGN            ║
-╚══════════════════════════════════════════════════════╝
-
-📡 OPERATING PARAMETERS
-  • Frequency (f)          : {results.get('f', 0):.4f} GHz
-  • Dielectric Const (εr)  : {results.get('e', 0):.4f}
-  • Conductor Height (t)   : {results.get('t', 0):.4f} mm
-  • Substrate Height (h)   : {results.get('h', 0):.4f} mm
-
-📏 PATCH DIMENSIONS
-  • Patch Width (W)        : {results.get('W', 0):.4f} mm
-  • Patch Length (L)       : {results.get('L', 0):.4f} mm
-  • Ground Width (Wg)      : {results.get('Wg', 0):.4f} mm
-  • Ground Length (Lg)     : {results.get('Lg', 0):.4f} mm
-
-🔌 FEED PARAMETERS
-  • Inset Length (Fi)      : {results.get('Fi', 0):.4f} mm
-  • Feed Line Width (Wf)   : {results.get('Wf', 0):.4f} mm
-
-⚡ PERFORMANCE METRICS
-  • S11 Parameter          : {results.get('S11', 0):.4f} dB
-  • VSWR                   : {results.get('VSWR', 0):.4f}
-  • Input Impedance (Zin)  : {results.get('Zin', 0):.4f} Ω
-  • Radiation Res. (Rin)   : {results.get('Rin', 0):.4f} Ω
-
-🔬 DERIVED PARAMETERS
-  • Effective εr (εreff)   : {results.get('ereff', 0):.4f}
-  • Effective Length (Leff): {results.get('leff', 0):.4f} mm
-  • Fringing Ext. (ΔL)     : {results.get('dl', 0):.4f} mm
-"""
-
-            summary_text = f"""Design Summary for {results.get('f', 0):.2f} GHz Microstrip Patch Antenna
-{'=' * 60}
-
-The antenna has been designed with a patch size of {results.get('W', 0):.2f} × {results.get('L', 0):.2f} mm
-on a substrate with εr = {results.get('e', 0):.2f} and height = {results.get('h', 0):.2f} mm.
-
-Feed Configuration:
-  - Inset-fed microstrip line with Fi = {results.get('Fi', 0):.2f} mm
-  - Feed line width Wf = {results.get('Wf', 0):.2f} mm (for {results.get('Zo', 0):.0f}Ω impedance)
-
-Performance:
-  - Return Loss (S11): {results.get('S11', 0):.2f} dB
-  - VSWR: {results.get('VSWR', 0):.2f}:1
-  {'✓ Good matching (VSWR < 2)' if results.get('VSWR', 0) < 2 else '⚠ Poor matching (VSWR ≥ 2)'}
+        params_text, summary_text = get_kernel(antenna_type).report(results)
+        self.params_text.setText(params_text)
+        self.summary_text.setText(summary_text)
 
-Recommended ground plane: {results.get('Wg', 0):.2f} × {results.get('Lg', 0):.2f} mm
-"""
+    def show_comparison(self, entries, keys, table):
+        """Side-by-side table of stored designs"""
+        header = f"{'Parameter':<14}" + ''.join(f"{'#' + str(i + 1):>16}" for i in entries)
+        lines = [header, '─' * len(header)]
+        for key, row in zip(keys, table):
+            lines.append(f"{key:<14}" + ''.join(
+                f"{'—':>16}" if value != value else f"{value:>16.4f}" for value in row))
+        types = [self.history.antenna_type(i) for i in entries]
+        lines += ['', *(f"#{i + 1}: {t}" for i, t in zip(entries, types))]
 
-        elif antenna_type == "Coaxial Feed Patch Antenna (Beta)":
-            params_text = f"""Operating Frequency (f)   : {results.get('f', 0):.4f} GHz
-Dielectric Constant (εr)  : {results.get('e', 0):.4f}
-Conductor Height (t)      : {results.get('t', 0):.4f} mm
-Substrate Height (h)      : {results.get('h', 0):.4f} mm
-Patch Width (W)           : {results.get('W', 0):.4f} mm
-Patch Length (L)          : {results.get('L', 0):.4f} mm
-Ground Width (Wg)         : {results.get('Wg', 0):.4f} mm
-Ground Length (Lg)        : {results.get('Lg', 0):.4f} mm
-Feed Point Xf             : {results.get('Xf', 0):.4f} mm
-Feed Point Yf             : {results.get('Yf', 0):.4f} mm"""
-            summary_text = "Coaxial feed antenna design completed."
-
-        else:  # Circularly Polarized
-            params_text = f"""Operating Frequency (f)   : {results.get('f', 0):.4f} GHz
-Dielectric Constant (εr)  : {results.get('e', 0):.4f}
-Conductor Height (t)      : {results.get('t', 0):.4f} mm
-Substrate Height (h)      : {results.get('h', 0):.4f} mm
-Patch Width (W)           : {results.get('W', 0):.4f} mm
-Patch Length (L)          : {results.get('L', 0):.4f} mm
-Ground Width (Wg)         : {results.get('Wg', 0):.4f} mm
-Ground Length (Lg)        : {results.get('Lg', 0):.4f} mm
-Corner Trunc Size (a)     : {results.get('a', 0):.4f} mm
-Quality Factor (Q)        : {results.get('Q', 0):.4f}"""
-            summary_text = "Circularly polarized antenna design completed."
+        self.compare_text.setText('\n'.join(lines))
+        self.tabs.setCurrentWidget(self.compare_text)
 
-        self.params_text.setText(params_text)
-        self.summary_text.setText(summary_text)
+    def show_pareto_front(self, front):
+        self.pareto_plot.plot_front(front)
+        self.tabs.setCurrentWidget(self.pareto_plot)
 
     def show_error(self, error_msg):
         error_text = f"""╔══════════════════════════════════════════════════════╗
@@ -337,6 +498,7 @@ class StructurePlot(QGroupBox):
     def plot_structure(self, ground_coords, patch_coords, patch_ext_coords, Wg, Lg):
         """Plot antenna structure"""
         self.ax.clear()
+        self.feed_image, self.feed_marker = None, None
         # Plot ground plane
         ground_style = PLOT_COLORS['ground_plane']
         self.ax.fill(ground_coords['x'], ground_coords['y'],
@@ -375,8 +537,36 @@ class StructurePlot(QGroupBox):
         self.figure.tight_layout()
         self.canvas.draw()
 
+    def feed_map_resolution(self, x0, y0, W, L, limit=400):
+        """Grid size (nx, ny) matching the patch's on-screen size in pixels"""
+        corners = self.ax.transData.transform([(x0, y0), (x0 + W, y0 + L)])
+        nx, ny = np.abs(corners[1] - corners[0]).astype(int)
+        return int(np.clip(nx, 16, limit)), int(np.clip(ny, 16, limit))
+
+    def plot_feed_map(self, feed_map, x0, y0, W, L):
+        """Overlay S11 against probe position on the patch, reusing the image if shown"""
+        extent = (x0, x0 + W, y0, y0 + L)
+        best = (x0 + feed_map['best_x'], y0 + feed_map['best_y'])
+        if self.feed_image is None:
+            self.feed_image = self.ax.imshow(feed_map['S11'], extent=extent, origin='lower',
+                                             cmap='viridis_r', alpha=0.75, zorder=3,
+                                             interpolation='bilinear')
+            self.feed_marker, = self.ax.plot(*best, marker='x', color='red', markersize=10,
+                                             markeredgewidth=2, linestyle='none', zorder=4)
+            self.ax.set_aspect('equal')
+        else:
+            self.feed_image.set_data(feed_map['S11'])
+            self.feed_image.set_extent(extent)
+            self.feed_image.autoscale()
+            self.feed_marker.set_data([best[0]], [best[1]])
+
+        self.feed_marker.set_label(f"Best Feed ({feed_map['best_S11']:.1f} dB)")
+        self.ax.legend(loc='upper right', framealpha=0.9, fontsize=FONT_SIZES['tiny'])
+        self.canvas.draw_idle()
+
     def clear_plot(self):
         self.ax.clear()
+        self.feed_image, self.feed_marker = None, None
         self.ax.set_title('Antenna Structure Preview', fontsize=FONT_SIZES['medium'], fontweight='bold')
         self.ax.grid(True, linestyle='--', alpha=0.3)
         self.ax.text(0.5, 0.5, 'Run calculation to view structure',
@@ -387,9 +577,24 @@ class StructurePlot(QGroupBox):
 class antennacalculator(QMainWindow):
     def __init__(self):
         super().__init__()
-        self.calculator = AntennaCalculator()
+        # Startup problems are shown in the status bar once it exists
+        warnings = []
+        try:
+            self.history = DesignHistory()
+        except (OSError, ValueError) as e:
+            warnings.append(f"Design history unavailable: {e}")
+            self.history = None
+        try:
+            load_plugins()
+        except Exception as e:
+            warnings.append(f"Antenna type plugins unavailable: {e}")
+        self.calculator = AntennaCalculator(history=self.history)
+        self.feed_map_request = 0
+        self.feed_map_threads = []
         self.setup_ui()
         self.connect_signals()
+        if warnings:
+            self.status_bar.showMessage("⚠️ " + "; ".join(warnings), 10000)
 
     def setup_ui(self):
         self.setWindowTitle("Microstrip Patch Antenna Parameter Calculator")
@@ -406,7 +611,7 @@ class antennacalculator(QMainWindow):
         # Create panels
         self.input_panel = InputPanel()
         self.structure_plot = StructurePlot()
-        self.output_panel = OutputPanel()
+        self.output_panel = OutputPanel(self.history)
 
         # LEFT COLUMN (Column 0): Input Parameters + Structure Plot
         left_column = QWidget()
@@ -445,6 +650,14 @@ class antennacalculator(QMainWindow):
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
 
+        # Tools menu
+        tools_menu = menu_bar.addMenu("🛠️ Tools")
+
+        self.search_action = QAction("🔍 Design Search", self)
+        self.search_action.setShortcut("Ctrl+D")
+        self.search_action.triggered.connect(self.on_design_search_requested)
+        tools_menu.addAction(self.search_action)
+
         # Help menu
         help_menu = menu_bar.addMenu("ℹ️ About")
 
@@ -461,6 +674,9 @@ class antennacalculator(QMainWindow):
     def connect_signals(self):
         """Connect signals and slots"""
         self.input_panel.calculate_requested.connect(self.on_calculate_requested)
+        if self.history is not None:
+            self.output_panel.history_panel.recall_requested.connect(self.on_recall_requested)
+            self.output_panel.history_panel.compare_requested.connect(self.on_compare_requested)
 
     @pyqtSlot(dict)
     def on_calculate_requested(self, params):
@@ -472,6 +688,8 @@ class antennacalculator(QMainWindow):
                 params['Zo'], params['antenna_type'], params['auto_calculate_h']
             )
             self.on_calculation_complete(results)
+            if self.history is not None:
+                self.output_panel.history_panel.model.entry_added()
             self.status_bar.showMessage(f"✅ Calculation complete - {params['antenna_type']}", 5000)
         except Exception as e:
             self.on_calculation_error(str(e))
@@ -485,20 +703,93 @@ class antennacalculator(QMainWindow):
         self.output_panel.update_output(results, antenna_type)
 
         # Update plots
-        if antenna_type == "Microstrip Patch Antenna (Inset-Fed)":
-            ground_coords, patch_coords, patch_ext_coords = \
-                self.calculator.get_structure_coordinates(
-                    results['Fi'], results['Wf'], results['W'], results['L'],
-                    results['Lg'], results['Wg'], results['dl']
-                )
-
+        kernel = get_kernel(antenna_type)
+        outline = kernel.geometry(results)
+        self.feed_map_request += 1
+        if outline is not None:
+            ground_coords, patch_coords, patch_ext_coords = outline
             self.structure_plot.plot_structure(
                 ground_coords, patch_coords, patch_ext_coords,
                 results['Wg'], results['Lg']
             )
+            if kernel.probe_fed:
+                self.start_feed_map(results)
         else:
             self.structure_plot.clear_plot()
 
+    def start_feed_map(self, results):
+        """Compute the probe impedance map at screen resolution in the background"""
+        x0, y0 = (results['Wg'] - results['W']) / 2, (results['Lg'] - results['L']) / 2
+        nx, ny = self.structure_plot.feed_map_resolution(x0, y0, results['W'], results['L'])
+        thread = FeedMapThread(self.calculator, results, nx, ny, self.feed_map_request)
+        thread.map_complete.connect(self.on_feed_map_complete)
+        thread.map_failed.connect(self.on_feed_map_failed)
+        thread.finished.connect(lambda: self.feed_map_threads.remove(thread))
+        self.feed_map_threads.append(thread)
+        self.feed_map_origin = (x0, y0, results['W'], results['L'])
+        thread.start()
+
+    @pyqtSlot(int, dict)
+    def on_feed_map_complete(self, request, feed_map):
+        # A newer calculation has replaced the plot this map was computed for
+        if request != self.feed_map_request:
+            return
+        self.structure_plot.plot_feed_map(feed_map, *self.feed_map_origin)
+
+    @pyqtSlot(int, str)
+    def on_feed_map_failed(self, request, error_msg):
+        if request == self.feed_map_request:
+            self.status_bar.showMessage(f"❌ Feed map failed: {error_msg}", 5000)
+
+    @pyqtSlot(int)
+    def on_recall_requested(self, entry):
+        """Show a stored design without recalculating it"""
+        results = self.history[entry]
+        try:
+            # A plugin type recorded in an earlier session may not be installed now
+            get_kernel(results['antenna_type'])
+        except ValueError as e:
+            self.on_calculation_error(str(e))
+            self.status_bar.showMessage(f"❌ Cannot recall design #{entry + 1}: {e}", 5000)
+            return
+        self.input_panel.set_values(results)
+        self.calculator.current_results = results
+        self.on_calculation_complete(results)
+        self.output_panel.tabs.setCurrentWidget(self.output_panel.params_text)
+        self.status_bar.showMessage(f"↩ Recalled design #{entry + 1} - {results['antenna_type']}", 5000)
+
+    @pyqtSlot(list)
+    def on_compare_requested(self, entries):
+        keys, table = self.history.compare(entries)
+        self.output_panel.show_comparison(entries, keys, table)
+        self.status_bar.showMessage(f"⚖️ Comparing {len(entries)} designs", 5000)
+
+    def on_design_search_requested(self):
+        """Search substrates and feed impedances around the current inputs"""
+        self.search_action.setEnabled(False)
+        self.status_bar.showMessage("⏳ Searching design space...")
+        self.search_thread = DesignSearchThread(self.input_panel.get_values())
+        self.search_thread.progress.connect(self.on_design_search_progress)
+        self.search_thread.search_complete.connect(self.on_design_search_complete)
+        self.search_thread.search_failed.connect(self.on_design_search_failed)
+        self.search_thread.start()
+
+    @pyqtSlot(int, int)
+    def on_design_search_progress(self, evaluated, total):
+        self.status_bar.showMessage(f"⏳ Searching design space... {evaluated:,} / {total:,}")
+
+    @pyqtSlot(dict)
+    def on_design_search_complete(self, front):
+        self.search_action.setEnabled(True)
+        self.output_panel.show_pareto_front(front)
+        self.status_bar.showMessage(
+            f"✅ Design search complete - {len(front['e'])} Pareto-optimal designs", 5000)
+
+    @pyqtSlot(str)
+    def on_design_search_failed(self, error_msg):
+        self.search_action.setEnabled(True)
+        self.status_bar.showMessage(f"❌ Design search failed: {error_msg}", 5000)
+
     def on_calculation_error(self, error_msg):
         """Handle calculation errors"""
         self.output_panel.show_error(error_msg)
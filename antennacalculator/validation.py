@@ -0,0 +1,38 @@
+import numpy as np
+
+# Per-row error codes: bit flags, OR-ed together; 0 means the row is valid
+ERR_INPUT = 1 << 0          # non-finite or non-positive f, εr, h, Zo, or negative t
+ERR_PERMITTIVITY = 1 << 1   # εr < 1
+ERR_ASPECT = 1 << 2         # W/h <= 0.8, where the fringing model is singular
+ERR_LENGTH = 1 << 3         # fringing extension eats the whole patch (L <= 0)
+ERR_FEED_WIDTH = 1 << 4     # feed line width Wf <= 0
+ERR_MATCH = 1 << 5          # Γ = 0 or |Γ| >= 1: S11/VSWR not finite
+ERR_NON_FINITE = 1 << 6     # any other non-finite output
+ERR_CONVERGENCE = 1 << 7    # iterative geometry solver did not converge
+
+ERROR_MESSAGES = {
+    ERR_INPUT: "inputs must be finite and positive (t may be zero)",
+    ERR_PERMITTIVITY: "dielectric constant must be at least 1",
+    ERR_ASPECT: "patch width must exceed 0.8 times the substrate height",
+    ERR_LENGTH: "fringing extension exceeds the effective length (L <= 0)",
+    ERR_FEED_WIDTH: "feed line width is not positive",
+    ERR_MATCH: "S11/VSWR undefined for this match",
+    ERR_NON_FINITE: "non-finite result",
+    ERR_CONVERGENCE: "geometry solver did not converge"
+}
+
+
+def flag(condition, code):
+    """code where condition holds, else 0, as a uint16 array"""
+    return np.where(condition, np.uint16(code), np.uint16(0))
+
+
+def describe_errors(error_code):
+    """Messages for every flag set in a single error code"""
+    return [message for code, message in ERROR_MESSAGES.items() if int(error_code) & code]
+
+
+def error_summary(error_code):
+    """Row count per flag for an array of error codes"""
+    error_code = np.asarray(error_code)
+    return {code: int(np.count_nonzero(error_code & code)) for code in ERROR_MESSAGES}
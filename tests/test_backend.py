@@ -0,0 +1,116 @@
+import numpy as np
+import pytest
+
+from antennacalculator.backend import JACOBIAN_INPUTS, AntennaCalculator
+from antennacalculator.validation import (ERR_FEED_WIDTH, ERR_INPUT, ERR_PERMITTIVITY,
+                                          error_summary)
+
+INSET_FED = "Microstrip Patch Antenna (Inset-Fed)"
+
+
+def test_calculate_parameters_matches_batch():
+    calc = AntennaCalculator()
+    batch = calc.calculate_batch([2.4, 5.8], [4.4, 2.2], 0.035, [1.6, 0.8], 50.0, INSET_FED)
+
+    for i, (f, e, h) in enumerate([(2.4, 4.4, 1.6), (5.8, 2.2, 0.8)]):
+        single = calc.calculate_parameters(f, e, 0.035, h, 50.0, INSET_FED)
+        for key in ('W', 'L', 'S11', 'Wf', 'VSWR'):
+            assert single[key] == pytest.approx(batch[key][i])
+    assert calc.current_results is single
+
+
+def test_calculate_parameters_rejects_non_finite_results():
+    with pytest.raises(Exception, match="Calculation error"):
+        AntennaCalculator().calculate_parameters(2.4, -3.0, 0.035, 1.6, 50.0, INSET_FED)
+
+
+@pytest.mark.parametrize("auto_calculate_h", [False, True])
+def test_jacobian_matches_finite_differences(auto_calculate_h):
+    calc = AntennaCalculator()
+    point = {'f': 2.4, 'e': 4.4, 'h': 1.6, 't': 0.035, 'Zo': 50.0}
+    nominal = calc.calculate_batch(point['f'], point['e'], point['t'], point['h'], point['Zo'],
+                                   INSET_FED, auto_calculate_h, jacobian=True)
+
+    def outputs(p):
+        r = calc.calculate_batch(p['f'], p['e'], p['t'], p['h'], p['Zo'], INSET_FED, auto_calculate_h)
+        f_res = calc.calculate_resonant_frequency(r['e'], r['h'], nominal['W'], nominal['L'])
+        return np.array([r['W'], r['L'], f_res, r['S11'], r['Wf']])
+
+    numeric = np.empty((5, 5))
+    for j, name in enumerate(JACOBIAN_INPUTS):
+        step = 1e-6 * max(1.0, point[name])
+        plus, minus = dict(point), dict(point)
+        plus[name] += step
+        minus[name] -= step
+        numeric[:, j] = (outputs(plus) - outputs(minus)) / (2 * step)
+
+    assert np.allclose(nominal['jacobian'], numeric, rtol=1e-5, atol=1e-7)
+
+
+def test_validation_flags_bad_rows_without_aborting_batch():
+    calc = AntennaCalculator()
+    e = np.array([4.4, -3.0, 0.5, 4.4, 4.4])
+    h = np.array([1.6, 1.6, 1.6, np.nan, 1.6])
+    Zo = np.array([50.0, 50.0, 50.0, 50.0, 5000.0])
+
+    results = calc.calculate_batch(2.4, e, 0.035, h, Zo, INSET_FED, validate=True)
+    code = results['error_code']
+
+    assert results['status'].tolist() == [True, False, False, False, False]
+    assert code[0] == 0
+    assert code[1] & ERR_INPUT
+    assert code[2] & ERR_PERMITTIVITY and not code[2] & ERR_INPUT
+    assert code[3] & ERR_INPUT
+    assert code[4] & ERR_FEED_WIDTH
+    assert np.isfinite(results['S11'][0])
+    assert error_summary(code)[ERR_INPUT] == 2
+
+
+def test_calculate_parameters_reports_error_messages():
+    with pytest.raises(ValueError, match="feed line width"):
+        AntennaCalculator().calculate_parameters(2.4, 4.4, 0.035, 1.6, 5000.0, INSET_FED)
+
+
+def test_mode_spectrum_dominant_mode_and_ordering():
+    calc = AntennaCalculator()
+    results = calc.calculate_batch([2.4, 5.8, 10.0], [4.4, 2.2, 10.2], 0.035, [1.6, 0.8, 0.5],
+                                   50.0, INSET_FED)
+
+    spectrum = calc.calculate_mode_spectrum(results, n_modes=5)
+    f_res = calc.calculate_resonant_frequency(results['e'], results['h'], results['W'], results['L'])
+
+    assert spectrum['frequencies'].shape == (3, 5)
+    assert np.all(np.diff(spectrum['frequencies'], axis=1) >= 0)
+    tm10 = (spectrum['m'] == 1) & (spectrum['n'] == 0)
+    assert np.all(tm10.sum(axis=1) == 1)
+    assert np.allclose(spectrum['frequencies'][tm10], f_res)
+
+
+def test_spurious_mode_mask():
+    calc = AntennaCalculator()
+    results = calc.calculate_batch(2.4, [2.2, 10.2], 0.035, 1.6, 50.0, INSET_FED)
+    spectrum = calc.calculate_mode_spectrum(results, n_modes=4)
+    highest = spectrum['frequencies'][:, -1]
+
+    around_highest = calc.spurious_mode_mask(spectrum, (highest - 0.01, highest + 0.01))
+    design_band = calc.spurious_mode_mask(spectrum, (2.3, 2.5))
+    with_tm01 = calc.spurious_mode_mask(spectrum, (0.1, 2.5))
+
+    assert around_highest.tolist() == [True, True]
+    assert design_band.tolist() == [False, False]
+    assert with_tm01.tolist() == [True, True]
+    assert not calc.spurious_mode_mask(spectrum, (0.1, 2.5), intended=((1, 0), (0, 1))).any()
+
+
+def test_feed_map_edge_and_centre_impedance():
+    calc = AntennaCalculator()
+    results = calc.calculate_batch(2.4, 4.4, 0.035, 1.6, 50.0, "Coaxial Feed Patch Antenna (Beta)")
+
+    feed_map = calc.calculate_feed_map(results, nx=60, ny=80)
+
+    assert feed_map['S11'].shape == (80, 60)
+    # Resonant TM10: high resistance at the radiating edge, a short at the centre line
+    assert feed_map['Zin'][0, 30].real > 100
+    assert abs(feed_map['Zin'][40, 30].real) < 5
+    assert feed_map['best_S11'] == feed_map['S11'].min() < -15
+    assert 0 < feed_map['best_y'] < results['L'] / 2
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from antennacalculator.design_search import DesignSearch, dominated_by, pareto_front
+
+
+def brute_force_front(points):
+    dominated = [np.any(np.all(points <= p, axis=1) & np.any(points < p, axis=1)) for p in points]
+    return {tuple(p) for p in points[~np.array(dominated)]}
+
+
+@pytest.mark.parametrize("dims", [2, 3, 4])
+def test_pareto_front_matches_brute_force(dims):
+    rng = np.random.default_rng(dims)
+    points = np.round(rng.random((2000, dims)), 2)  # rounding forces ties and duplicates
+
+    front = pareto_front(points)
+
+    assert {tuple(p) for p in points[front]} == brute_force_front(points)
+    assert len(front) == len({tuple(p) for p in points[front]})
+
+
+def test_dominated_by_matches_brute_force():
+    rng = np.random.default_rng(0)
+    front, candidates = rng.random((300, 4)), rng.random((3000, 4))
+
+    expected = [np.any(np.all(front <= c, axis=1)) for c in candidates]
+
+    assert np.array_equal(dominated_by(candidates, front), expected)
+
+
+def test_chunked_grid_search_matches_one_shot_front():
+    search = DesignSearch(2.4)
+    e_values, h_values, Zo_values = (2.2, 4.4, 10.2), np.linspace(0.4, 3.2, 15), np.linspace(40, 100, 7)
+
+    front = search.search(e_values, h_values, Zo_values=Zo_values, resolution=None, chunk_size=50)
+
+    e, h, Zo = (a.ravel() for a in np.meshgrid(e_values, h_values, Zo_values, indexing='ij'))
+    _, objectives, valid = search.evaluate(e, 0.035, h, Zo)
+    expected = objectives[valid][pareto_front(objectives[valid])]
+    assert front['evaluated'] == e.size
+    assert {tuple(p) for p in front['objectives']} == {tuple(p) for p in expected}
+
+
+def test_random_search_returns_non_dominated_designs():
+    search = DesignSearch(2.4)
+
+    front = search.search((2.2, 10.2), (0.4, 3.2), Zo_values=(40, 100), n_samples=20000,
+                          seed=1, chunk_size=3000)
+
+    assert front['evaluated'] == 20000
+    assert len(front['e']) > 0
+    assert len(pareto_front(front['objectives'])) == len(front['e'])
+    assert np.allclose(front['results']['W'] * front['results']['L'], front['objectives'][:, 0])
+
+
+def test_search_without_s11_model_drops_objective():
+    search = DesignSearch(2.4, "Coaxial Feed Patch Antenna (Beta)")
+
+    front = search.search((2.2, 4.4), (0.8, 1.6))
+
+    assert 'S11' not in front['objective_names']
+    assert front['objectives'].shape[1] == len(front['objective_names'])
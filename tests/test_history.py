@@ -0,0 +1,48 @@
+import math
+
+from antennacalculator.backend import AntennaCalculator
+from antennacalculator.history import DesignHistory
+
+
+def calculate(history, f, antenna_type="Microstrip Patch Antenna (Inset-Fed)"):
+    return AntennaCalculator(history=history).calculate_parameters(f, 4.4, 0.035, 1.6, 50.0, antenna_type)
+
+
+def test_designs_persist_and_reload_without_recomputation(tmp_path):
+    path = tmp_path / "history.bin"
+    history = DesignHistory(str(path))
+    first = calculate(history, 2.4)
+    second = calculate(history, 5.8, "Coaxial Feed Patch Antenna (Beta)")
+
+    reopened = DesignHistory(str(path))
+
+    assert len(reopened) == 2
+    assert reopened[0] == first
+    assert reopened[-1] == second
+    assert reopened.antenna_type(1) == "Coaxial Feed Patch Antenna (Beta)"
+
+
+def test_torn_final_record_is_dropped(tmp_path):
+    path = tmp_path / "history.bin"
+    history = DesignHistory(str(path))
+    calculate(history, 2.4)
+    calculate(history, 2.5)
+    with open(path, 'r+b') as handle:
+        handle.truncate(path.stat().st_size - 5)
+
+    reopened = DesignHistory(str(path))
+    calculate(reopened, 2.6)
+
+    assert [round(DesignHistory(str(path))[i]['f'], 2) for i in range(2)] == [2.4, 2.6]
+
+
+def test_compare_fills_missing_outputs_with_nan(tmp_path):
+    history = DesignHistory(str(tmp_path / "history.bin"))
+    calculate(history, 2.4)
+    calculate(history, 2.4, "Circularly Polarized Antennas (Beta)")
+
+    keys, table = history.compare([0, 1])
+
+    assert keys[:2] == ['f', 'e']
+    assert table[keys.index('S11')][0] < 0 and math.isnan(table[keys.index('S11')][1])
+    assert math.isnan(table[keys.index('Q')][0]) and table[keys.index('Q')][1] > 0
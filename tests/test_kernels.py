@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+
+from antennacalculator.backend import AntennaCalculator, c
+from antennacalculator.design_search import DesignSearch
+from antennacalculator.kernels import (KERNELS, AntennaKernel, get_kernel, register_kernel,
+                                       solve_circular_radius)
+
+
+def test_mixed_batch_matches_per_type_batches():
+    calc = AntennaCalculator()
+    types = np.array(list(KERNELS))[np.arange(30) % len(KERNELS)]
+    e = np.linspace(2.2, 10.2, 30)
+    h = np.linspace(0.5, 3.0, 30)
+
+    mixed = calc.calculate_mixed_batch(2.4, e, 0.035, h, 50.0, types)
+
+    for name in KERNELS:
+        rows = types == name
+        single = calc.calculate_batch(2.4, e[rows], 0.035, h[rows], 50.0, name)
+        for key in mixed:
+            if key == 'antenna_type':
+                continue
+            expected = single.get(key, np.full(rows.sum(), np.nan))
+            assert np.allclose(mixed[key][rows], expected, equal_nan=True), (name, key)
+
+
+def test_kernel_outputs_match_batch_keys():
+    calc = AntennaCalculator()
+    for name, kernel in KERNELS.items():
+        results = calc.calculate_batch(2.4, 4.4, 0.035, 1.6, 50.0, name)
+        assert set(kernel.outputs) <= set(results)
+        params_text, summary_text = kernel.report(calc.calculate_parameters(2.4, 4.4, 0.035, 1.6, 50.0, name))
+        assert params_text and summary_text
+
+
+def test_registered_kernel_is_dispatched():
+    @register_kernel
+    class SquarePatch(AntennaKernel):
+        name = "Test Square Patch"
+        outputs = ('side',)
+
+        def compute(self, base):
+            return {'side': np.sqrt(base['W'] * base['L'])}
+
+    try:
+        results = AntennaCalculator().calculate_batch(2.4, 4.4, 0.035, 1.6, 50.0, "Test Square Patch")
+        assert np.isclose(results['side'], np.sqrt(results['W'] * results['L']))
+    finally:
+        del KERNELS["Test Square Patch"]
+
+    with pytest.raises(ValueError):
+        get_kernel("Test Square Patch")
+
+
+def test_circular_radius_solver_converges_per_element():
+    f = np.array([1.5, 2.4, 10.0, np.nan])
+    e = np.array([2.2, 4.4, 10.2, 4.4])
+    h = np.array([0.8, 1.6, 0.635, 1.6])
+
+    R, Re, iterations, converged = solve_circular_radius(f, e, h)
+
+    assert converged.tolist() == [True, True, True, False]
+    assert np.all(iterations[:3] > 1) and iterations[3] == 0
+    # Effective radius puts TM11 at the design frequency
+    f_res = 1.8412 * c / (2 * np.pi * Re[:3] * np.sqrt(e[:3])) / 1e9
+    assert np.allclose(f_res, f[:3])
+    assert np.all(R[:3] < Re[:3])
+
+
+def test_circular_radius_solver_does_not_converge_on_nan():
+    # Substrate far thicker than the patch: the fringing term goes negative
+    R, Re, iterations, converged = solve_circular_radius([60.0], [2.2], [10.0])
+
+    assert np.isnan(R[0]) and not converged[0]
+    results = AntennaCalculator().calculate_batch(60.0, 2.2, 0.035, 10.0, 50.0,
+                                                  "Circular Patch Antenna", validate=True)
+    assert not results['status']
+
+
+def test_circular_patch_batch_search_and_geometry():
+    calc = AntennaCalculator()
+    results = calc.calculate_batch(2.4, [2.2, 4.4], 0.035, 1.6, 50.0, "Circular Patch Antenna",
+                                   validate=True)
+    assert results['status'].all()
+    assert np.allclose(results['W'], 2 * results['R'])
+
+    ground, patch, _ = get_kernel("Circular Patch Antenna").geometry(
+        calc.calculate_parameters(2.4, 4.4, 0.035, 1.6, 50.0, "Circular Patch Antenna"))
+    radius = np.hypot(np.array(patch['x']) - ground['x'][1] / 2, np.array(patch['y']) - ground['y'][2] / 2)
+    assert np.allclose(radius, results['R'][1])
+
+    front = DesignSearch(2.4, "Circular Patch Antenna").search((2.2, 4.4, 10.2), (0.8, 1.6))
+    assert np.allclose(np.pi * front['results']['R'] ** 2, front['objectives'][:, 0])
+
+    with pytest.raises(ValueError):
+        calc.calculate_batch(2.4, 4.4, 0.035, 1.6, 50.0, "Circular Patch Antenna", jacobian=True)
+    with pytest.raises(ValueError):
+        calc.calculate_mode_spectrum(results)
+    with pytest.raises(ValueError):
+        calc.calculate_feed_map(calc.calculate_parameters(2.4, 4.4, 0.035, 1.6, 50.0,
+                                                          "Circular Patch Antenna"))
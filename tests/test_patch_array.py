@@ -0,0 +1,56 @@
+import numpy as np
+
+from antennacalculator.backend import AntennaCalculator
+from antennacalculator.patch_array import PatchArray
+
+
+def _element():
+    return AntennaCalculator().calculate_parameters(2.4, 4.4, 0.035, 1.6, 50.0,
+                                                    "Microstrip Patch Antenna (Inset-Fed)")
+
+
+def test_broadside_directivity_matches_aperture_estimate():
+    array = PatchArray(_element(), 16, 16)
+    aperture = (16 * array.dx) * (16 * array.dy)
+
+    expected = 10 * np.log10(4 * np.pi * aperture / array.wavelength ** 2)
+    assert abs(array.calculate_metrics()['directivity_dBi'] - expected) < 0.5
+
+
+def test_uniform_taper_sidelobe_level():
+    metrics = PatchArray(_element(), 32, 32).calculate_metrics()
+
+    assert abs(metrics['sll_dB'] + 13.3) < 0.2
+
+
+def test_large_array_beamwidth_is_resolved():
+    array = PatchArray(_element(), 64, 64)
+
+    reference = array.calculate_metrics(n_cut=72001, n_theta=91, n_phi=181)['beamwidth']
+    assert abs(array.calculate_metrics(n_theta=91, n_phi=181)['beamwidth'] - reference) < 0.01
+    assert 1.5 < reference < 1.7
+
+
+def test_grating_lobes_beyond_half_wavelength_spacing():
+    wavelength = PatchArray(_element()).wavelength
+    array = PatchArray(_element(), 8, 8, dx=0.7 * wavelength, dy=0.5 * wavelength)
+
+    max_scan = np.degrees(np.arcsin(1 / 0.7 - 1))
+    lobes = array.grating_lobes([0.0, max_scan - 1, max_scan + 1], 0.0)
+
+    assert np.isclose(lobes['max_scan_x'], max_scan)
+    assert list(lobes['has_grating_lobes']) == [False, False, True]
+    # First-order lobe of the last scan angle at sin(theta) = sin(theta0) - lambda / dx
+    expected = np.degrees(np.arcsin(abs(np.sin(np.radians(max_scan + 1)) - 1 / 0.7)))
+    assert np.isclose(np.nanmin(lobes['lobe_theta'][2]), expected, atol=1e-6)
+
+
+def test_scan_sweep_matches_single_metrics():
+    element = _element()
+    angles = [0.0, 20.0, 40.0]
+    sweep = PatchArray(element, 16, 16).scan_sweep(angles)
+
+    for i, angle in enumerate(angles):
+        metrics = PatchArray(element, 16, 16, theta0=angle).calculate_metrics()
+        assert np.isclose(sweep['directivity_dBi'][i], metrics['directivity_dBi'])
+        assert np.isclose(sweep['beamwidth'][i], metrics['beamwidth'])
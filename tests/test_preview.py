@@ -0,0 +1,48 @@
+import subprocess
+import sys
+
+import numpy as np
+
+from antennacalculator.backend import AntennaCalculator
+from antennacalculator.kernels import KERNELS
+from antennacalculator.preview import PreviewRenderer, render_previews
+
+
+def test_renderer_reuses_artists_and_writes_png_and_svg(tmp_path):
+    calc = AntennaCalculator()
+    renderer = PreviewRenderer()
+    polygons = list(renderer.polygons)
+
+    inset = calc.calculate_parameters(2.4, 4.4, 0.035, 1.6, 50.0, "Microstrip Patch Antenna (Inset-Fed)")
+    circular = calc.calculate_parameters(2.4, 4.4, 0.035, 1.6, 50.0, "Circular Patch Antenna")
+
+    assert renderer.render(inset, tmp_path / 'inset.png')
+    assert len(renderer.polygons[2].get_xy()) >= 12
+    assert renderer.render(circular, tmp_path / 'circular.svg')
+
+    assert renderer.polygons == polygons
+    assert len(renderer.ax.patches) == 3
+    assert (tmp_path / 'inset.png').read_bytes().startswith(b'\x89PNG')
+    assert b'<svg' in (tmp_path / 'circular.svg').read_bytes()
+
+
+def test_preview_module_does_not_import_qt():
+    code = ("import sys, antennacalculator.preview; "
+            "sys.exit(any(name.startswith('PyQt') for name in sys.modules))")
+    assert subprocess.run([sys.executable, '-c', code]).returncode == 0
+
+
+def test_render_previews_in_pool(tmp_path):
+    calc = AntennaCalculator()
+    types = np.array(list(KERNELS))[np.arange(8) % len(KERNELS)]
+    batch = calc.calculate_mixed_batch(2.4, np.linspace(2.2, 10.2, 8), 0.035, 1.6, 50.0, types)
+    batch['Wg'][0] = np.nan
+
+    paths = render_previews(batch, tmp_path, workers=2, chunk_size=3)
+
+    drawable = [KERNELS[name].geometry(calc.calculate_parameters(2.4, 4.4, 0.035, 1.6, 50.0, name))
+                is not None for name in types]
+    assert len(paths) == 8 and paths[0] is None
+    for i in range(1, 8):
+        assert (paths[i] is not None) == drawable[i]
+        assert (tmp_path / f'design_{i:06d}.png').exists() == drawable[i]
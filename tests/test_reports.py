@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from antennacalculator.backend import AntennaCalculator
+from antennacalculator.kernels import KERNELS
+from antennacalculator.reports import export_reports, format_column
+from antennacalculator.templates import ReportTemplate
+
+INSET_FED = "Microstrip Patch Antenna (Inset-Fed)"
+
+
+def mixed_batch(n=9):
+    types = np.array(list(KERNELS))[np.arange(n) % len(KERNELS)]
+    return AntennaCalculator().calculate_mixed_batch(2.4, np.linspace(2.2, 10.2, n), 0.035, 1.6,
+                                                     50.0, types, validate=True)
+
+
+def test_template_render_matches_columns_and_derived_fields():
+    def note(results):
+        return np.where(np.asarray(results.get('W', 0)) > 30, 'wide', 'narrow')
+
+    template = ReportTemplate("W = {W:.2f} mm, {note}", derived={'note': note})
+    batch = AntennaCalculator().calculate_batch(2.4, [2.2, 10.2], 0.035, 1.6, 50.0, INSET_FED)
+
+    rows = template.render_columns(batch)
+
+    assert rows == [template.render({'W': batch['W'][i]}) for i in range(2)]
+    assert rows[0].endswith('wide') and rows[1].endswith('narrow')
+    assert template.render({}) == "W = 0.00 mm, narrow"
+
+
+def test_kernel_report_columns_match_single_reports():
+    calc = AntennaCalculator()
+    for name, kernel in KERNELS.items():
+        batch = calc.calculate_batch(2.4, [2.2, 4.4], 0.035, 1.6, 50.0, name)
+        params, summaries = kernel.report_columns(batch)
+        for i, e in enumerate((2.2, 4.4)):
+            single = calc.calculate_parameters(2.4, e, 0.035, 1.6, 50.0, name)
+            assert (params[i], summaries[i]) == kernel.report(single)
+
+
+def test_format_column_marks_missing_values():
+    assert format_column([1.234, np.nan, np.inf], '.1f') == ['1.2', '—', '—']
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_html_and_markdown_reports(tmp_path, workers):
+    batch = mixed_batch()
+
+    html_path = export_reports(batch, str(tmp_path / 'report.html'), workers=workers, chunk_size=4)
+    md_path = export_reports(batch, str(tmp_path / 'report.md'), workers=workers, chunk_size=4)
+
+    html = open(html_path, encoding='utf-8').read()
+    assert html.count('<section') == 9 and html.rstrip().endswith('</html>')
+    assert html.index('id="design-1"') < html.index('id="design-9"')
+    assert 'data:image/png;base64,' in html
+
+    markdown = open(md_path, encoding='utf-8').read()
+    assert markdown.count('## Design ') == 9
+    assert (tmp_path / 'report_previews' / 'design_000001.png').exists()
+    assert 'MICROSTRIP PATCH ANTENNA DESIGN' in markdown
+
+
+def test_pdf_report(tmp_path):
+    path = export_reports(mixed_batch(5), str(tmp_path / 'report.pdf'))
+
+    data = open(path, 'rb').read()
+    assert data.startswith(b'%PDF') and data.count(b'/Type /Page\n') + data.count(b'/Type /Page ') >= 6
@@ -0,0 +1,47 @@
+import numpy as np
+
+from antennacalculator.backend import AntennaCalculator
+from antennacalculator.tolerance import StreamingHistogram, ToleranceAnalysis
+
+
+def test_zero_tolerance_reproduces_nominal_design():
+    analysis = ToleranceAnalysis({'e': 0.0, 'h': 0.0, 't': 0.0, 'etch': 0.0})
+    nominal = AntennaCalculator().calculate_parameters(2.4, 4.4, 0.0, 1.6, 50.0,
+                                                       "Microstrip Patch Antenna (Inset-Fed)")
+
+    result = analysis.run(2.4, 4.4, 0.0, 1.6, 50.0, n_samples=1000)
+
+    assert np.allclose(result['f_res_mean'], 2.4, rtol=1e-6)
+    assert result['yield'][0] == (1.0 if nominal['S11'] < -10 else 0.0)
+
+
+def test_runs_are_reproducible_and_bounded():
+    analysis = ToleranceAnalysis()
+
+    first = analysis.run(2.4, [2.2, 4.4], 0.035, 1.6, 50.0, n_samples=20000, seed=7, chunk_size=5000)
+    second = analysis.run(2.4, [2.2, 4.4], 0.035, 1.6, 50.0, n_samples=20000, seed=7, chunk_size=5000)
+
+    assert np.array_equal(first['f_res_histogram'], second['f_res_histogram'])
+    assert np.array_equal(first['yield'], second['yield'])
+    assert np.all((first['yield_ci'][:, 0] <= first['yield']) & (first['yield'] <= first['yield_ci'][:, 1]))
+
+
+def test_streaming_histogram_quantiles_match_numpy():
+    rng = np.random.default_rng(0)
+    samples = rng.normal(0, 1, (2, 50000))
+    histogram = StreamingHistogram(-5, 5, 1000, 2)
+
+    for chunk in np.split(samples, 5, axis=1):
+        histogram.update(chunk)
+
+    expected = np.quantile(samples, [0.05, 0.5, 0.95], axis=1).T
+    assert np.allclose(histogram.quantiles([0.05, 0.5, 0.95]), expected, atol=0.02)
+
+
+def test_streaming_histogram_quantiles_of_empty_design_are_nan():
+    histogram = StreamingHistogram(-5, 5, 100, 2)
+    histogram.update(np.array([[0.0, 1.0], [np.nan, np.nan]]))
+
+    quantiles = histogram.quantiles([0.5])
+    assert np.isfinite(quantiles[0]).all()
+    assert np.isnan(quantiles[1]).all()
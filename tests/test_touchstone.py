@@ -0,0 +1,64 @@
+import numpy as np
+
+from antennacalculator.backend import AntennaCalculator
+from antennacalculator.kernels import KERNELS, InsetFedKernel, register_kernel
+from antennacalculator.touchstone import export_s1p
+
+INSET_FED = "Microstrip Patch Antenna (Inset-Fed)"
+
+
+def read_s1p(path):
+    with open(path) as handle:
+        lines = [line for line in handle if not line.startswith('!')]
+    assert lines[0].split() == ['#', 'GHZ', 'S', 'RI', 'R', '50']
+    data = np.loadtxt(lines[1:])
+    return data[:, 0], data[:, 1] + 1j * data[:, 2]
+
+
+def test_impedance_sweep_matches_design_point():
+    calc = AntennaCalculator()
+    results = calc.calculate_batch([2.4, 5.8], [4.4, 2.2], 0.035, [1.6, 0.8], 50.0, INSET_FED)
+
+    Z = calc.calculate_impedance_sweep(results, [1.0, 2.4, 5.8])
+
+    assert Z.shape == (2, 3)
+    assert np.isclose(Z[0, 1], results['Zin'][0])
+    assert np.isclose(Z[1, 2], results['Zin'][1])
+    assert abs(Z[0, 0]) < results['Zin'][0]
+
+
+def test_export_s1p_serial_and_parallel(tmp_path):
+    calc = AntennaCalculator()
+    e, h = np.linspace(2.2, 10.2, 7), np.linspace(0.8, 1.6, 7)
+    frequencies = np.linspace(2.0, 2.8, 41)
+
+    serial = export_s1p(tmp_path / 'serial', 2.4, e, 0.035, h, 50.0, INSET_FED, frequencies,
+                        chunk_size=3)
+    parallel = export_s1p(tmp_path / 'parallel', 2.4, e, 0.035, h, 50.0, INSET_FED, frequencies,
+                          chunk_size=3, workers=2)
+
+    assert len(serial) == len(parallel) == 7
+    results = calc.calculate_batch(2.4, e, 0.035, h, 50.0, INSET_FED)
+    for i, (a, b) in enumerate(zip(serial, parallel)):
+        freq, s11 = read_s1p(a)
+        assert np.allclose(freq, frequencies)
+        assert np.allclose(s11, read_s1p(b)[1])
+        at_design = s11[np.argmin(np.abs(freq - 2.4))]
+        assert np.isclose(20 * np.log10(abs(at_design)), results['S11'][i], atol=1e-6)
+
+
+def test_export_s1p_skips_invalid_designs_and_escapes_type_names(tmp_path):
+    @register_kernel
+    class RenamedInsetFed(InsetFedKernel):
+        name = "Inset-Fed Patch – εr sweep"
+
+    try:
+        paths = export_s1p(tmp_path, 2.4, [4.4, 0.5, 2.2], 0.035, 1.6, 50.0,
+                           RenamedInsetFed.name, np.linspace(2.0, 2.8, 5))
+    finally:
+        del KERNELS[RenamedInsetFed.name]
+
+    assert paths[1] is None
+    assert read_s1p(paths[0])[1].shape == (5,) and read_s1p(paths[2])[1].shape == (5,)
+    with open(paths[0], encoding='ascii') as handle:
+        assert handle.readline() == "! Inset-Fed Patch \\u2013 \\u03b5r sweep\n"